@@ -1,29 +1,34 @@
 """The Tado X integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime
-from typing import Final
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from functools import lru_cache, partial
+from typing import Any, Final
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_DEVICE_ID, Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_DEVICE_ID, EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady, HomeAssistantError
-from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.loader import async_get_loaded_integration
 
 from .api import TadoXApi, TadoXApiError, TadoXAuthError
 from .const import (
+    API_MAX_CONCURRENT_REQUESTS,
     CONF_ACCESS_TOKEN,
     CONF_API_CALLS_TODAY,
     CONF_API_RESET_TIME,
-    CONF_ENABLE_AIR_COMFORT,
-    CONF_ENABLE_FLOW_TEMP,
-    CONF_ENABLE_MOBILE_DEVICES,
-    CONF_ENABLE_RUNNING_TIMES,
-    CONF_ENABLE_WEATHER,
     CONF_HAS_AUTO_ASSIST,
     CONF_HOME_ID,
     CONF_HOME_NAME,
@@ -31,12 +36,30 @@ from .const import (
     CONF_SCAN_INTERVAL,
     CONF_TOKEN_EXPIRY,
     DOMAIN,
+    FEATURE_FLAGS,
+    FEATURE_PLATFORMS,
     PLATFORMS,
+    Termination,
 )
-from .coordinator import TadoXDataUpdateCoordinator
+from .coordinator import TadoXConfigEntry, TadoXDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared by all config entries, so kept in hass.data rather than runtime_data
+REQUEST_LIMITER_KEY: Final = f"{DOMAIN}_request_limiter"
+
+# Config entry keys whose change requires the entry to be set up again
+_RELOAD_KEYS: Final = (
+    CONF_HOME_ID,
+    CONF_HOME_NAME,
+    CONF_SCAN_INTERVAL,
+    CONF_HAS_AUTO_ASSIST,
+    *FEATURE_FLAGS,
+)
+
+# Seconds to coalesce token and API stats writes to the config entry
+PERSIST_COOLDOWN: Final = 1.0
+
 # Service constants
 SERVICE_SET_TEMPERATURE_OFFSET: Final = "set_temperature_offset"
 ATTR_OFFSET: Final = "offset"
@@ -56,27 +79,51 @@ ATTR_ENTITY_ID: Final = "entity_id"
 ATTR_TEMPERATURE: Final = "temperature"
 ATTR_DURATION: Final = "duration"
 
+
+def _coerce_range(
+    number_type: type[float] | type[int],
+    minimum: float,
+    maximum: float | None = None,
+) -> Callable[[Any], float | int]:
+    """Return a validator coercing to number_type within an inclusive range.
+
+    Equivalent to vol.All(vol.Coerce(...), vol.Range(...)) in a single call.
+    """
+
+    def validate(value: Any) -> float | int:
+        try:
+            number = number_type(value)
+        except (TypeError, ValueError) as err:
+            raise vol.Invalid(f"expected {number_type.__name__}") from err
+        if number < minimum or (maximum is not None and number > maximum):
+            raise vol.Invalid(
+                f"value must be at least {minimum}"
+                if maximum is None
+                else f"value must be between {minimum} and {maximum}"
+            )
+        return number
+
+    return validate
+
+
 # Service schemas
 SERVICE_SET_TEMPERATURE_OFFSET_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_DEVICE_ID): cv.string,
-        vol.Required(ATTR_OFFSET): vol.All(
-            vol.Coerce(float),
-            vol.Range(min=-9.9, max=9.9),
-        ),
+        vol.Required(ATTR_OFFSET): _coerce_range(float, -9.9, 9.9),
     }
 )
 
 SERVICE_ADD_METER_READING_SCHEMA = vol.Schema(
     {
-        vol.Required(ATTR_READING): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Required(ATTR_READING): _coerce_range(int, 0),
         vol.Optional(ATTR_DATE): cv.string,
     }
 )
 
 SERVICE_SET_EIQ_TARIFF_SCHEMA = vol.Schema(
     {
-        vol.Required(ATTR_TARIFF): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Required(ATTR_TARIFF): _coerce_range(float, 0),
         vol.Required(ATTR_UNIT): vol.In(["m3", "kWh"]),
         vol.Optional(ATTR_START_DATE): cv.string,
         vol.Optional(ATTR_END_DATE): cv.string,
@@ -86,117 +133,361 @@ SERVICE_SET_EIQ_TARIFF_SCHEMA = vol.Schema(
 SERVICE_SET_CLIMATE_TIMER_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_ENTITY_ID): cv.entity_id,
-        vol.Required(ATTR_TEMPERATURE): vol.All(
-            vol.Coerce(float),
-            vol.Range(min=5.0, max=25.0),
-        ),
-        vol.Required(ATTR_DURATION): vol.All(
-            vol.Coerce(int),
-            vol.Range(min=1, max=1440),  # 1 minute to 24 hours
-        ),
+        vol.Required(ATTR_TEMPERATURE): _coerce_range(float, 5.0, 25.0),
+        vol.Required(ATTR_DURATION): _coerce_range(int, 1, 1440),  # 1 minute to 24 hours
     }
 )
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+@lru_cache(maxsize=128)
+def _parse_iso(value: str | None) -> datetime | None:
+    """Parse a persisted ISO timestamp, memoized across setups and reloads.
+
+    Older versions stored the token expiry as naive local time; such values
+    are converted to aware UTC so they compare with the API client's clock.
+    """
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+    return parsed if parsed.tzinfo else parsed.astimezone(UTC)
+
+
+def _config_signature(data: Mapping[str, Any]) -> tuple[Any, ...]:
+    """Return the config entry values that require a reload when changed.
+
+    Tokens and API call stats are left out: the running client already
+    holds the current values, since it is the one that persisted them.
+    """
+    return tuple(data.get(key) for key in _RELOAD_KEYS)
+
+
+@callback
+def _async_update_entry_data(
+    hass: HomeAssistant, entry: TadoXConfigEntry, updates: dict[str, Any]
+) -> None:
+    """Merge updates into the config entry data.
+
+    Skips the write entirely when every value is already stored, so no
+    config entry copy or storage save is scheduled for no-op updates.
+    """
+    data = entry.data
+    if all(data.get(key) == value for key, value in updates.items()):
+        return
+    hass.config_entries.async_update_entry(entry, data={**data, **updates})
+
+
+@callback
+def _async_persist_api_state(
+    hass: HomeAssistant, entry: TadoXConfigEntry, api: TadoXApi
+) -> None:
+    """Save tokens and API call stats of a client to its config entry."""
+    _async_update_entry_data(
+        hass,
+        entry,
+        {
+            CONF_ACCESS_TOKEN: api.access_token,
+            CONF_REFRESH_TOKEN: api.refresh_token,
+            CONF_TOKEN_EXPIRY: api.token_expiry.isoformat() if api.token_expiry else None,
+            CONF_API_CALLS_TODAY: api.api_calls_today,
+            CONF_API_RESET_TIME: api.api_reset_time.isoformat(),
+            CONF_HAS_AUTO_ASSIST: api.has_auto_assist,
+        },
+    )
+    _LOGGER.debug("Tokens and API stats persisted to config entry")
+
+
+def _enabled_platforms(features: Mapping[str, bool]) -> tuple[Platform, ...]:
+    """Return the platforms to load, without those of disabled features."""
+    return tuple(
+        platform
+        for platform in PLATFORMS
+        if platform not in FEATURE_PLATFORMS or features[FEATURE_PLATFORMS[platform]]
+    )
+
+
+@callback
+def _async_loaded_entries(hass: HomeAssistant) -> list[TadoXConfigEntry]:
+    """Return the loaded Tado X config entries."""
+    return [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+    ]
+
+
+@callback
+def _async_get_coordinator(
+    hass: HomeAssistant, entry_id: str | None = None
+) -> TadoXDataUpdateCoordinator:
+    """Return the coordinator of a loaded Tado X config entry.
+
+    Without an entry_id the first loaded home is used, for services that do
+    not target a specific device or entity.
+    """
+    if entry_id is None:
+        if entries := _async_loaded_entries(hass):
+            return entries[0].runtime_data
+    elif (
+        (entry := hass.config_entries.async_get_entry(entry_id))
+        and entry.domain == DOMAIN
+        and entry.state is ConfigEntryState.LOADED
+    ):
+        return entry.runtime_data
+    raise HomeAssistantError("No Tado X home is loaded")
+
+
+async def _async_set_temperature_offset(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle set_temperature_offset service call."""
+    device_id = call.data[ATTR_DEVICE_ID]
+    offset = call.data[ATTR_OFFSET]
+
+    # Find the home the device belongs to and its identifier
+    # Identifier format is (DOMAIN, serial_number) or (DOMAIN, home_id_room_id)
+    for entry in _async_loaded_entries(hass):
+        coordinator = entry.runtime_data
+        if device_serial := coordinator.async_get_device_serial(device_id):
+            break
+    else:
+        _LOGGER.error("Could not find serial number for device %s", device_id)
+        return
+
+    # Room, home and mobile devices are not physical Tado devices
+    if device_serial not in coordinator.data.devices:
+        _LOGGER.error(
+            "Cannot set temperature offset for %s, it is not a Tado device. "
+            "Please select a specific valve or sensor device.",
+            device_id,
+        )
+        return
+
+    try:
+        await coordinator.api.set_temperature_offset(device_serial, offset)
+        await coordinator.async_request_refresh()
+        _LOGGER.info(
+            "Set temperature offset for device %s to %.1f°C",
+            device_serial,
+            offset,
+        )
+    except Exception as err:
+        _LOGGER.error(
+            "Failed to set temperature offset for device %s: %s",
+            device_serial,
+            err,
+        )
+
+
+async def _async_add_meter_reading(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle add_meter_reading service call."""
+    coordinator = _async_get_coordinator(hass)
+    reading = call.data[ATTR_READING]
+    date = call.data.get(ATTR_DATE)
+
+    try:
+        await coordinator.api.add_meter_reading(reading, date)
+        _LOGGER.info("Meter reading %s added successfully", reading)
+    except TadoXApiError as err:
+        _LOGGER.error("Failed to add meter reading: %s", err)
+        raise HomeAssistantError(f"Failed to add meter reading: {err}") from err
+
+
+async def _async_set_eiq_tariff(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle set_eiq_tariff service call."""
+    coordinator = _async_get_coordinator(hass)
+    tariff = call.data[ATTR_TARIFF]
+    unit = call.data[ATTR_UNIT]
+    start_date = call.data.get(ATTR_START_DATE)
+    end_date = call.data.get(ATTR_END_DATE)
+
+    try:
+        await coordinator.api.set_eiq_tariff(tariff, unit, start_date, end_date)
+        _LOGGER.info("EIQ tariff %.2f %s set successfully", tariff, unit)
+    except TadoXApiError as err:
+        _LOGGER.error("Failed to set EIQ tariff: %s", err)
+        raise HomeAssistantError(f"Failed to set EIQ tariff: {err}") from err
+
+
+async def _async_set_climate_timer(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle set_climate_timer service call."""
+    entity_id = call.data[ATTR_ENTITY_ID]
+    temperature = call.data[ATTR_TEMPERATURE]
+    duration_minutes = call.data[ATTR_DURATION]
+
+    # Get the entity from registry
+    entity_registry = er.async_get(hass)
+    entity_entry = entity_registry.async_get(entity_id)
+
+    if not entity_entry:
+        raise HomeAssistantError(f"Entity {entity_id} not found in registry")
+
+    # Verify this is a Tado X entity
+    if entity_entry.platform != DOMAIN:
+        raise HomeAssistantError(
+            f"Entity {entity_id} is not a Tado X entity (platform: {entity_entry.platform}). "
+            f"The set_climate_timer service only works with native Tado X climate entities."
+        )
+
+    if not entity_entry.unique_id:
+        raise HomeAssistantError(f"Entity {entity_id} has no unique_id")
+
+    coordinator = _async_get_coordinator(hass, entity_entry.config_entry_id)
+
+    # Extract room_id from unique_id
+    # The unique_id for Tado X climate entities is "{home_id}_{room_id}_climate"
+    try:
+        parts = entity_entry.unique_id.split("_")
+        if len(parts) == 3 and parts[2] == "climate":
+            # Format: "12345_67_climate" where 12345 is home_id and 67 is room_id
+            room_id = int(parts[1])
+        elif len(parts) == 2:
+            # Legacy format: "12345_67" (backward compatibility)
+            room_id = int(parts[1])
+        else:
+            raise ValueError(f"Unexpected unique_id format: {entity_entry.unique_id}")
+    except (ValueError, IndexError) as err:
+        raise HomeAssistantError(
+            f"Could not extract room_id from entity {entity_id}: {err}"
+        ) from err
+
+    # Convert minutes to seconds
+    duration_seconds = duration_minutes * 60
+
+    try:
+        await coordinator.api.set_room_temperature(
+            room_id=room_id,
+            temperature=temperature,
+            power="ON",
+            termination_type=Termination.TIMER,
+            duration_seconds=duration_seconds,
+        )
+        await coordinator.async_request_refresh()
+        _LOGGER.info(
+            "Set %s to %.1f°C for %d minutes",
+            entity_id,
+            temperature,
+            duration_minutes,
+        )
+    except TadoXApiError as err:
+        _LOGGER.error("Failed to set climate timer: %s", err)
+        raise HomeAssistantError(f"Failed to set climate timer: {err}") from err
+
+
+_SERVICES: Final = (
+    (
+        SERVICE_SET_TEMPERATURE_OFFSET,
+        _async_set_temperature_offset,
+        SERVICE_SET_TEMPERATURE_OFFSET_SCHEMA,
+    ),
+    (SERVICE_ADD_METER_READING, _async_add_meter_reading, SERVICE_ADD_METER_READING_SCHEMA),
+    (SERVICE_SET_EIQ_TARIFF, _async_set_eiq_tariff, SERVICE_SET_EIQ_TARIFF_SCHEMA),
+    (SERVICE_SET_CLIMATE_TIMER, _async_set_climate_timer, SERVICE_SET_CLIMATE_TIMER_SCHEMA),
+)
+
+
+@callback
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the integration services (only once per integration).
+
+    Handlers live at module level and resolve the coordinator per call, so
+    they hold no reference to a particular config entry.
+    """
+    for service, handler, schema in _SERVICES:
+        if not hass.services.has_service(DOMAIN, service):
+            hass.services.async_register(DOMAIN, service, partial(handler, hass), schema=schema)
+
+
+@callback
+def _async_remove_services(hass: HomeAssistant) -> None:
+    """Remove the integration services once the last entry is unloaded."""
+    for service, _handler, _schema in _SERVICES:
+        hass.services.async_remove(DOMAIN, service)
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: TadoXConfigEntry) -> bool:
     """Set up Tado X from a config entry."""
     session = async_get_clientsession(hass)
+    # One limiter for the whole integration, shared by the clients of all homes
+    request_limiter: asyncio.Semaphore = hass.data.setdefault(
+        REQUEST_LIMITER_KEY, asyncio.Semaphore(API_MAX_CONCURRENT_REQUESTS)
+    )
 
-    # Parse token expiry
-    token_expiry = None
-    if entry.data.get(CONF_TOKEN_EXPIRY):
-        try:
-            token_expiry = datetime.fromisoformat(entry.data[CONF_TOKEN_EXPIRY])
-        except (ValueError, TypeError):
-            pass
+    # Snapshot the entry data once; the callbacks below write a new mapping
+    data = entry.data
+    has_auto_assist = data.get(CONF_HAS_AUTO_ASSIST, False)
 
-    # Parse API reset time for persistence
-    api_reset_time = None
-    if entry.data.get(CONF_API_RESET_TIME):
-        try:
-            api_reset_time = datetime.fromisoformat(entry.data[CONF_API_RESET_TIME])
-        except (ValueError, TypeError):
-            pass
+    # Parse token expiry and API reset time for persistence
+    token_expiry = _parse_iso(data.get(CONF_TOKEN_EXPIRY))
+    api_reset_time = _parse_iso(data.get(CONF_API_RESET_TIME))
 
     # Create a mutable container for the API reference (needed for callback closure)
     api_container: dict[str, TadoXApi] = {}
 
-    def save_tokens() -> None:
-        """Save tokens to config entry after refresh to prevent auth loss on restart."""
-        if "api" not in api_container:
-            return
-        api = api_container["api"]
-        hass.config_entries.async_update_entry(
-            entry,
-            data={
-                **entry.data,
-                CONF_ACCESS_TOKEN: api.access_token,
-                CONF_REFRESH_TOKEN: api.refresh_token,
-                CONF_TOKEN_EXPIRY: api.token_expiry.isoformat() if api.token_expiry else None,
-            },
-        )
-        _LOGGER.debug("Tokens persisted to config entry")
+    @callback
+    def persist_api_state() -> None:
+        """Save tokens and API call stats to the config entry.
+
+        This prevents auth loss on restart and is the only write needed after
+        the initial token refresh during setup.
+        """
+        if "api" in api_container:
+            _async_persist_api_state(hass, entry, api_container["api"])
+
+    # A token refresh and the API stats update of the same poll end up in one write
+    persister = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=PERSIST_COOLDOWN,
+        immediate=False,
+        function=persist_api_state,
+    )
+
+    @callback
+    def flush_api_state(_event: Event | None = None) -> None:
+        """Write pending tokens and API stats now (on unload or shutdown).
+
+        Late calls from a client that is being torn down are ignored afterwards.
+        """
+        persister.async_shutdown()
+        persist_api_state()
+
+    # Registered before anything can fail, so rotated tokens are never lost
+    entry.async_on_unload(flush_api_state)
+    entry.async_on_unload(hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, flush_api_state))
 
     api = TadoXApi(
         session=session,
-        access_token=entry.data.get(CONF_ACCESS_TOKEN),
-        refresh_token=entry.data.get(CONF_REFRESH_TOKEN),
+        access_token=data.get(CONF_ACCESS_TOKEN),
+        refresh_token=data.get(CONF_REFRESH_TOKEN),
         token_expiry=token_expiry,
-        api_calls_today=entry.data.get(CONF_API_CALLS_TODAY, 0),
+        api_calls_today=data.get(CONF_API_CALLS_TODAY, 0),
         api_reset_time=api_reset_time,
-        has_auto_assist=entry.data.get(CONF_HAS_AUTO_ASSIST, False),
-        on_token_refresh=save_tokens,
+        has_auto_assist=has_auto_assist,
+        on_token_refresh=persister.async_schedule_call,
+        request_limiter=request_limiter,
+        create_background_task=partial(entry.async_create_background_task, hass),
     )
     api_container["api"] = api
+    entry.async_on_unload(api.close)
 
-    home_id = entry.data[CONF_HOME_ID]
-    home_name = entry.data.get(CONF_HOME_NAME, f"Tado Home {home_id}")
+    home_id = data[CONF_HOME_ID]
+    home_name = data.get(CONF_HOME_NAME, f"Tado Home {home_id}")
 
     # Test the connection and refresh token if needed
+    # (tokens and API call stats are persisted through the debounced persister)
     try:
         await api.refresh_access_token()
-
-        # Update stored tokens and API call stats
-        hass.config_entries.async_update_entry(
-            entry,
-            data={
-                **entry.data,
-                CONF_ACCESS_TOKEN: api.access_token,
-                CONF_REFRESH_TOKEN: api.refresh_token,
-                CONF_TOKEN_EXPIRY: api.token_expiry.isoformat() if api.token_expiry else None,
-                CONF_API_CALLS_TODAY: api.api_calls_today,
-                CONF_API_RESET_TIME: api.api_reset_time.isoformat(),
-                CONF_HAS_AUTO_ASSIST: api.has_auto_assist,
-            },
-        )
     except TadoXAuthError as err:
         _LOGGER.error("Authentication failed: %s", err)
         raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
 
-    # Create callback to save API stats periodically
-    def save_api_stats() -> None:
-        """Save API call statistics to config entry."""
-        hass.config_entries.async_update_entry(
-            entry,
-            data={
-                **entry.data,
-                CONF_API_CALLS_TODAY: api.api_calls_today,
-                CONF_API_RESET_TIME: api.api_reset_time.isoformat(),
-            },
-        )
-
     # Get configured scan interval (or None to use auto-detection based on tier)
-    configured_scan_interval = entry.data.get(CONF_SCAN_INTERVAL)
+    configured_scan_interval = data.get(CONF_SCAN_INTERVAL)
 
     # Get feature toggles - default based on subscription tier
     # Auto-Assist users get all features enabled, free tier users get them disabled
-    has_auto_assist = entry.data.get(CONF_HAS_AUTO_ASSIST, False)
-    default_features = has_auto_assist
-    enable_weather = entry.data.get(CONF_ENABLE_WEATHER, default_features)
-    enable_mobile_devices = entry.data.get(CONF_ENABLE_MOBILE_DEVICES, default_features)
-    enable_air_comfort = entry.data.get(CONF_ENABLE_AIR_COMFORT, default_features)
-    enable_running_times = entry.data.get(CONF_ENABLE_RUNNING_TIMES, default_features)
-    enable_flow_temp = entry.data.get(CONF_ENABLE_FLOW_TEMP, default_features)
+    features = {key: data.get(key, has_auto_assist) for key in FEATURE_FLAGS}
 
     # Create coordinator
     coordinator = TadoXDataUpdateCoordinator(
@@ -204,198 +495,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         api=api,
         home_id=home_id,
         home_name=home_name,
-        save_api_stats_callback=save_api_stats,
+        save_api_stats_callback=persister.async_schedule_call,
         scan_interval=configured_scan_interval if configured_scan_interval else None,
-        enable_weather=enable_weather,
-        enable_mobile_devices=enable_mobile_devices,
-        enable_air_comfort=enable_air_comfort,
-        enable_running_times=enable_running_times,
-        enable_flow_temp=enable_flow_temp,
+        **features,
     )
+    coordinator.config_signature = _config_signature(data)
+    coordinator.platforms = _enabled_platforms(features)
 
-    # Fetch initial data
+    # Fetch initial data while the platform modules are imported in the executor,
+    # so the forward below does not have to wait for the imports
+    integration = async_get_loaded_integration(hass, DOMAIN)
     try:
-        await coordinator.async_config_entry_first_refresh()
+        await asyncio.gather(
+            coordinator.async_config_entry_first_refresh(),
+            integration.async_get_platforms(coordinator.platforms),
+        )
     except TadoXApiError as err:
         raise ConfigEntryNotReady(f"Failed to fetch data: {err}") from err
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
-
-    # Register services
-    async def async_set_temperature_offset(call: ServiceCall) -> None:
-        """Handle set_temperature_offset service call."""
-        device_id = call.data[ATTR_DEVICE_ID]
-        offset = call.data[ATTR_OFFSET]
-
-        # Get device registry
-        device_registry_instance = dr.async_get(hass)
-        device = device_registry_instance.async_get(device_id)
-
-        if not device:
-            _LOGGER.error("Device %s not found", device_id)
-            return
-
-        # Find the device serial number from identifiers
-        device_serial = None
-        for identifier in device.identifiers:
-            if identifier[0] == DOMAIN:
-                # Identifier format is (DOMAIN, serial_number) or (DOMAIN, home_id_room_id)
-                device_serial = identifier[1]
-                break
-
-        if not device_serial:
-            _LOGGER.error("Could not find serial number for device %s", device_id)
-            return
-
-        # Check if this is a room device (format: home_id_room_id) or a real device
-        if "_" in device_serial:
-            _LOGGER.error(
-                "Cannot set temperature offset for room device %s. "
-                "Please select a specific valve or sensor device.",
-                device_id,
-            )
-            return
-
-        try:
-            await coordinator.api.set_temperature_offset(device_serial, offset)
-            await coordinator.async_request_refresh()
-            _LOGGER.info(
-                "Set temperature offset for device %s to %.1f°C",
-                device_serial,
-                offset,
-            )
-        except Exception as err:
-            _LOGGER.error(
-                "Failed to set temperature offset for device %s: %s",
-                device_serial,
-                err,
-            )
-
-    # Register temperature offset service (only once per integration)
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_TEMPERATURE_OFFSET):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SET_TEMPERATURE_OFFSET,
-            async_set_temperature_offset,
-            schema=SERVICE_SET_TEMPERATURE_OFFSET_SCHEMA,
-        )
-
-    async def async_add_meter_reading(call: ServiceCall) -> None:
-        """Handle add_meter_reading service call."""
-        reading = call.data[ATTR_READING]
-        date = call.data.get(ATTR_DATE)
-
-        try:
-            await coordinator.api.add_meter_reading(reading, date)
-            _LOGGER.info("Meter reading %s added successfully", reading)
-        except TadoXApiError as err:
-            _LOGGER.error("Failed to add meter reading: %s", err)
-            raise HomeAssistantError(f"Failed to add meter reading: {err}") from err
-
-    # Register meter reading service (only once per integration)
-    if not hass.services.has_service(DOMAIN, SERVICE_ADD_METER_READING):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_ADD_METER_READING,
-            async_add_meter_reading,
-            schema=SERVICE_ADD_METER_READING_SCHEMA,
-        )
+    entry.runtime_data = coordinator
 
-    async def async_set_eiq_tariff(call: ServiceCall) -> None:
-        """Handle set_eiq_tariff service call."""
-        tariff = call.data[ATTR_TARIFF]
-        unit = call.data[ATTR_UNIT]
-        start_date = call.data.get(ATTR_START_DATE)
-        end_date = call.data.get(ATTR_END_DATE)
+    # Reload when the options change; token and API stat writes are skipped there
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
-        try:
-            await coordinator.api.set_eiq_tariff(tariff, unit, start_date, end_date)
-            _LOGGER.info("EIQ tariff %.2f %s set successfully", tariff, unit)
-        except TadoXApiError as err:
-            _LOGGER.error("Failed to set EIQ tariff: %s", err)
-            raise HomeAssistantError(f"Failed to set EIQ tariff: {err}") from err
-
-    # Register EIQ tariff service (only once per integration)
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_EIQ_TARIFF):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SET_EIQ_TARIFF,
-            async_set_eiq_tariff,
-            schema=SERVICE_SET_EIQ_TARIFF_SCHEMA,
+    # Keep the coordinator's device identifier cache in sync with the registry
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED,
+            coordinator.async_handle_device_registry_updated,
         )
+    )
 
-    async def async_set_climate_timer(call: ServiceCall) -> None:
-        """Handle set_climate_timer service call."""
-        entity_id = call.data[ATTR_ENTITY_ID]
-        temperature = call.data[ATTR_TEMPERATURE]
-        duration_minutes = call.data[ATTR_DURATION]
-
-        # Get the entity from registry
-        from homeassistant.helpers import entity_registry as er
-        entity_registry = er.async_get(hass)
-        entity_entry = entity_registry.async_get(entity_id)
-
-        if not entity_entry:
-            raise HomeAssistantError(f"Entity {entity_id} not found in registry")
-
-        # Verify this is a Tado X entity
-        if entity_entry.platform != DOMAIN:
-            raise HomeAssistantError(
-                f"Entity {entity_id} is not a Tado X entity (platform: {entity_entry.platform}). "
-                f"The set_climate_timer service only works with native Tado X climate entities."
-            )
-
-        if not entity_entry.unique_id:
-            raise HomeAssistantError(f"Entity {entity_id} has no unique_id")
-
-        # Extract room_id from unique_id
-        # The unique_id for Tado X climate entities is "{home_id}_{room_id}_climate"
-        try:
-            parts = entity_entry.unique_id.split("_")
-            if len(parts) == 3 and parts[2] == "climate":
-                # Format: "12345_67_climate" where 12345 is home_id and 67 is room_id
-                room_id = int(parts[1])
-            elif len(parts) == 2:
-                # Legacy format: "12345_67" (backward compatibility)
-                room_id = int(parts[1])
-            else:
-                raise ValueError(f"Unexpected unique_id format: {entity_entry.unique_id}")
-        except (ValueError, IndexError) as err:
-            raise HomeAssistantError(
-                f"Could not extract room_id from entity {entity_id}: {err}"
-            ) from err
-
-        # Convert minutes to seconds
-        duration_seconds = duration_minutes * 60
-
-        try:
-            await coordinator.api.set_room_temperature(
-                room_id=room_id,
-                temperature=temperature,
-                power="ON",
-                termination_type="TIMER",
-                duration_seconds=duration_seconds,
-            )
-            await coordinator.async_request_refresh()
-            _LOGGER.info(
-                "Set %s to %.1f°C for %d minutes",
-                entity_id,
-                temperature,
-                duration_minutes,
-            )
-        except TadoXApiError as err:
-            _LOGGER.error("Failed to set climate timer: %s", err)
-            raise HomeAssistantError(f"Failed to set climate timer: {err}") from err
-
-    # Register climate timer service (only once per integration)
-    if not hass.services.has_service(DOMAIN, SERVICE_SET_CLIMATE_TIMER):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_SET_CLIMATE_TIMER,
-            async_set_climate_timer,
-            schema=SERVICE_SET_CLIMATE_TIMER_SCHEMA,
-        )
+    _async_register_services(hass)
 
     # Create the "Home" device before loading platforms to ensure via_device references work
     # This prevents deprecation warnings about via_device referencing non-existing devices
@@ -408,20 +539,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         model="Tado X Home",
     )
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
 
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(hass: HomeAssistant, entry: TadoXConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, entry.runtime_data.platforms
+    ):
+        # Let a token refresh that already reached Tado finish before the entry's
+        # unload callbacks flush the tokens, so a rotated refresh token is kept
+        api = entry.runtime_data.api
+        api.close()
+        await api.async_wait_for_token_refresh()
+
+        if not any(
+            other.entry_id != entry.entry_id for other in _async_loaded_entries(hass)
+        ):
+            _async_remove_services(hass)
 
     return unload_ok
 
 
-async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+async def async_reload_entry(hass: HomeAssistant, entry: TadoXConfigEntry) -> None:
+    """Reload config entry, unless only tokens or API stats changed."""
+    # runtime_data is set before this listener is registered, so the check also
+    # covers writes that land while the platforms are still being set up
+    if entry.runtime_data.config_signature == _config_signature(entry.data):
+        return
+
+    await hass.config_entries.async_reload(entry.entry_id)
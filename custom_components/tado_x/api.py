@@ -3,13 +3,32 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Any
+import random
+import re
+from collections.abc import Callable, Coroutine
+from datetime import UTC, datetime, timedelta
+from typing import Any, Final
 
 import aiohttp
+from aiohttp import hdrs
 import ssl
 
+try:
+    # Home Assistant ships orjson; fall back to the stdlib outside of it
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    from json import dumps as _json_dumps, loads as _json_loads
+
 from .const import (
+    API_MAX_CONCURRENT_REQUESTS,
+    POLL_INTERVAL,
+    POLL_INTERVAL_BUFFER,
+    POLL_MAX_INTERVAL,
+    POLL_SLOW_DOWN_STEP,
+    POLL_TIMEOUT,
+    RATE_LIMIT_MAX_RETRY_AFTER,
+    RATE_LIMIT_RETRIES,
+    TOKEN_REFRESH_MARGIN,
     TADO_AUTH_URL,
     TADO_CLIENT_ID,
     TADO_EIQ_API_URL,
@@ -17,10 +36,36 @@ from .const import (
     TADO_MINDER_API_URL,
     TADO_MY_API_URL,
     TADO_TOKEN_URL,
+    Termination,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Rate limit header fields, parsed on every API response
+_QUOTA_LIMIT_RE = re.compile(r"q=(\d+)")
+_QUOTA_REMAINING_RE = re.compile(r"r=(\d+)")
+
+# Static request headers, aiohttp copies them per request
+_FORM_HEADERS: Final = {hdrs.CONTENT_TYPE: "application/x-www-form-urlencoded"}
+_JSON_HEADERS: Final = {hdrs.CONTENT_TYPE: "application/json"}
+
+# The device authorization request must fail fast so the config flow can report it
+_AUTH_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
+
+
+def _jittered(delay: float) -> float:
+    """Return delay plus up to 30% random jitter, to spread out polling clients."""
+    return delay + random.uniform(0, delay * 0.3)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Return the delay of a Retry-After header given in seconds, if any."""
+    try:
+        return min(float(value), RATE_LIMIT_MAX_RETRY_AFTER) if value else None
+    except ValueError:
+        # HTTP-date form, fall back to exponential backoff
+        return None
+
 
 class TadoXAuthError(Exception):
     """Exception for authentication errors."""
@@ -33,10 +78,16 @@ class TadoXApiError(Exception):
 class TadoXRateLimitError(TadoXApiError):
     """Exception for rate limit (429) errors."""
 
-    def __init__(self, message: str, reset_time: datetime | None = None):
-        """Initialize with optional reset time."""
+    def __init__(
+        self,
+        message: str,
+        reset_time: datetime | None = None,
+        retry_after: float | None = None,
+    ):
+        """Initialize with optional reset time and Retry-After delay."""
         super().__init__(message)
         self.reset_time = reset_time
+        self.retry_after = retry_after
 
 
 class TadoXApi:
@@ -52,19 +103,46 @@ class TadoXApi:
         api_reset_time: datetime | None = None,
         has_auto_assist: bool = False,
         on_token_refresh: callable | None = None,
+        request_limiter: asyncio.Semaphore | None = None,
+        create_background_task: Callable[
+            [Coroutine[Any, Any, None], str], asyncio.Task
+        ] | None = None,
     ) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        request_limiter caps concurrent requests and may be shared between
+        clients so all homes together stay within the limit.
+        create_background_task runs the background token refresh, so the owner
+        tracks and cancels it; without it tokens are only refreshed on demand.
+        """
         self._session = session
+        self._request_limiter = request_limiter or asyncio.Semaphore(API_MAX_CONCURRENT_REQUESTS)
         self._access_token = access_token
         self._refresh_token = refresh_token
         self._token_expiry = token_expiry
         self._home_id: int | None = None
+        # Per-home base URLs, built when the home ID is set
+        self._hops_home_url = ""
+        self._my_home_url = ""
+        self._eiq_home_url = ""
+        self._minder_home_url = ""
         self._has_auto_assist = has_auto_assist
         self._on_token_refresh = on_token_refresh
 
+        # Serializes token refreshes of concurrent requests (Tado rotates refresh tokens)
+        self._refresh_lock = asyncio.Lock()
+
+        # Background token refresh, only while requests are due before the token expires
+        self._create_background_task = create_background_task
+        self._request_interval: float | None = None
+        # Pending refresh (cancellable) and the refresh talking to Tado (never cancelled)
+        self._refresh_timer: asyncio.TimerHandle | None = None
+        self._refresh_task: asyncio.Task | None = None
+        self._closed = False
+
         # Initialize API call tracking with persistence support
         # Tado resets quotas at 12:00 UTC (noon), not midnight
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         default_reset_time = self._calculate_next_reset_time(now)
 
         if api_reset_time and api_reset_time > now:
@@ -102,8 +180,17 @@ class TadoXApi:
 
     @home_id.setter
     def home_id(self, value: int) -> None:
-        """Set the home ID."""
+        """Set the home ID and build the per-home base URLs."""
         self._home_id = value
+        self._hops_home_url = f"{TADO_HOPS_API_URL}/homes/{value}"
+        self._my_home_url = f"{TADO_MY_API_URL}/homes/{value}"
+        self._eiq_home_url = f"{TADO_EIQ_API_URL}/homes/{value}"
+        self._minder_home_url = f"{TADO_MINDER_API_URL}/homes/{value}"
+
+    def _require_home_id(self) -> None:
+        """Raise if no home has been selected yet."""
+        if not self._home_id:
+            raise TadoXApiError("Home ID not set")
 
     @property
     def api_calls_today(self) -> int:
@@ -166,13 +253,15 @@ class TadoXApi:
         - ratelimit-policy: "perday";q=20000;w=86400 (q=quota limit, w=window in seconds)
         - ratelimit: "perday";r=17833 (r=remaining requests)
         """
-        import re
+        # Most responses carry neither header, skip the parsing for those
+        if "ratelimit-policy" not in headers and "ratelimit" not in headers:
+            return
 
         # Parse ratelimit-policy header for quota limit
         policy_header = headers.get("ratelimit-policy", "")
         if policy_header:
             # Extract q=NUMBER from the header
-            quota_match = re.search(r"q=(\d+)", policy_header)
+            quota_match = _QUOTA_LIMIT_RE.search(policy_header)
             if quota_match:
                 self._api_quota_limit = int(quota_match.group(1))
                 # Note: We no longer auto-detect Auto-Assist based on quota headers
@@ -183,7 +272,7 @@ class TadoXApi:
         ratelimit_header = headers.get("ratelimit", "")
         if ratelimit_header:
             # Extract r=NUMBER from the header
-            remaining_match = re.search(r"r=(\d+)", ratelimit_header)
+            remaining_match = _QUOTA_REMAINING_RE.search(ratelimit_header)
             if remaining_match:
                 self._api_quota_remaining = int(remaining_match.group(1))
 
@@ -193,55 +282,56 @@ class TadoXApi:
         Returns a dict with device_code, user_code, verification_uri, etc.
         """
         _LOGGER.warning("Starting device authorization flow")
-        timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
-
-        # Create SSL context that's more permissive for debugging
-        ssl_context = ssl.create_default_context()
-
-        # Create a dedicated session for auth to ensure timeout is respected
-        connector = aiohttp.TCPConnector(force_close=True, ssl=ssl_context)
-        async with aiohttp.ClientSession(
-            timeout=timeout,
-            connector=connector,
-        ) as auth_session:
-            try:
-                _LOGGER.warning("Sending request to %s", TADO_AUTH_URL)
-                async with auth_session.post(
-                    TADO_AUTH_URL,
-                    data={
-                        "client_id": TADO_CLIENT_ID,
-                        "scope": "offline_access",
-                    },
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
-                ) as response:
-                    _LOGGER.warning("Device auth response status: %s", response.status)
-                    if response.status != 200:
-                        text = await response.text()
-                        _LOGGER.error("Failed to start device auth: %s - %s", response.status, text)
-                        raise TadoXAuthError(f"Failed to start device auth: {response.status}")
-                    result = await response.json()
-                    _LOGGER.warning("Device auth successful, got user_code: %s", result.get("user_code"))
-                    return result
-            except asyncio.TimeoutError as err:
-                _LOGGER.error("Timeout during device auth request (30s)")
-                raise TadoXAuthError("Timeout during device auth request") from err
-            except aiohttp.ClientError as err:
-                _LOGGER.error("Network error during device auth: %s (type: %s)", err, type(err).__name__)
-                raise TadoXAuthError(f"Network error: {err}") from err
-            except ssl.SSLError as err:
-                _LOGGER.error("SSL error during device auth: %s", err)
-                raise TadoXAuthError(f"SSL error: {err}") from err
-            except Exception as err:
-                _LOGGER.error("Unexpected error during device auth: %s (type: %s)", err, type(err).__name__)
-                raise TadoXAuthError(f"Unexpected error: {err}") from err
-
-    async def poll_for_token(self, device_code: str, interval: int = 5, timeout: int = 300) -> bool:
+        try:
+            _LOGGER.warning("Sending request to %s", TADO_AUTH_URL)
+            async with self._session.post(
+                TADO_AUTH_URL,
+                data={
+                    "client_id": TADO_CLIENT_ID,
+                    "scope": "offline_access",
+                },
+                headers=_FORM_HEADERS,
+                timeout=_AUTH_TIMEOUT,
+            ) as response:
+                _LOGGER.warning("Device auth response status: %s", response.status)
+                if response.status != 200:
+                    text = await response.text()
+                    _LOGGER.error("Failed to start device auth: %s - %s", response.status, text)
+                    raise TadoXAuthError(f"Failed to start device auth: {response.status}")
+                result = await response.json()
+                _LOGGER.warning("Device auth successful, got user_code: %s", result.get("user_code"))
+                return result
+        except TadoXAuthError:
+            raise
+        except asyncio.TimeoutError as err:
+            _LOGGER.error("Timeout during device auth request (30s)")
+            raise TadoXAuthError("Timeout during device auth request") from err
+        except aiohttp.ClientError as err:
+            _LOGGER.error("Network error during device auth: %s (type: %s)", err, type(err).__name__)
+            raise TadoXAuthError(f"Network error: {err}") from err
+        except ssl.SSLError as err:
+            _LOGGER.error("SSL error during device auth: %s", err)
+            raise TadoXAuthError(f"SSL error: {err}") from err
+        except Exception as err:
+            _LOGGER.error("Unexpected error during device auth: %s (type: %s)", err, type(err).__name__)
+            raise TadoXAuthError(f"Unexpected error: {err}") from err
+
+    async def poll_for_token(
+        self, device_code: str, interval: float = POLL_INTERVAL, timeout: float = POLL_TIMEOUT
+    ) -> bool:
         """Poll for the access token after user authorizes.
 
+        The server-provided interval gets a safety buffer, and a slow_down
+        response backs off by a fixed step up to a capped interval (RFC 8628).
+        Cancelling the calling task stops the polling.
+
         Returns True if successful, False if timed out.
         """
-        start_time = datetime.now()
-        while (datetime.now() - start_time).seconds < timeout:
+        max_interval = max(2 * interval, POLL_MAX_INTERVAL)
+        interval *= POLL_INTERVAL_BUFFER
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while loop.time() < deadline:
             try:
                 async with self._session.post(
                     TADO_TOKEN_URL,
@@ -250,7 +340,7 @@ class TadoXApi:
                         "device_code": device_code,
                         "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
                     },
-                    headers={"Content-Type": "application/x-www-form-urlencoded"},
+                    headers=_FORM_HEADERS,
                 ) as response:
                     data = await response.json()
 
@@ -258,12 +348,20 @@ class TadoXApi:
                         self._access_token = data["access_token"]
                         self._refresh_token = data.get("refresh_token")
                         expires_in = data.get("expires_in", 600)
-                        self._token_expiry = datetime.now() + timedelta(seconds=expires_in)
+                        self._token_expiry = datetime.now(UTC) + timedelta(seconds=expires_in)
                         return True
 
+                    error = data.get("error")
+
+                    # Polling too fast, back off before continuing
+                    if error == "slow_down":
+                        interval = min(interval + POLL_SLOW_DOWN_STEP, max_interval)
+                        _LOGGER.debug("Token polling slowed down to %.1fs", interval)
+                        error = "authorization_pending"
+
                     # Authorization pending, continue polling
-                    if data.get("error") == "authorization_pending":
-                        await asyncio.sleep(interval)
+                    if error == "authorization_pending":
+                        await asyncio.sleep(_jittered(interval))
                         continue
 
                     # Other error
@@ -272,7 +370,7 @@ class TadoXApi:
 
             except aiohttp.ClientError as err:
                 _LOGGER.error("Network error during token polling: %s", err)
-                await asyncio.sleep(interval)
+                await asyncio.sleep(_jittered(interval))
 
         return False
 
@@ -289,7 +387,7 @@ class TadoXApi:
                     "grant_type": "refresh_token",
                     "refresh_token": self._refresh_token,
                 },
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                headers=_FORM_HEADERS,
             ) as response:
                 if response.status != 200:
                     text = await response.text()
@@ -300,11 +398,12 @@ class TadoXApi:
                 self._access_token = data["access_token"]
                 self._refresh_token = data.get("refresh_token", self._refresh_token)
                 expires_in = data.get("expires_in", 600)
-                self._token_expiry = datetime.now() + timedelta(seconds=expires_in)
+                self._token_expiry = datetime.now(UTC) + timedelta(seconds=expires_in)
 
                 # Persist tokens immediately after refresh to prevent auth loss on restart
                 if self._on_token_refresh:
                     self._on_token_refresh()
+                self._schedule_token_refresh()
 
                 _LOGGER.debug("Token refreshed successfully, expires in %s seconds", expires_in)
                 return True
@@ -312,14 +411,88 @@ class TadoXApi:
         except aiohttp.ClientError as err:
             raise TadoXAuthError(f"Network error during token refresh: {err}") from err
 
+    def set_request_interval(self, seconds: float) -> None:
+        """Set how often the owner polls, and plan the background refresh for it."""
+        self._request_interval = seconds
+        self._schedule_token_refresh()
+
+    def _schedule_token_refresh(self) -> None:
+        """Refresh the token in the background shortly before it expires.
+
+        Keeps the refresh round-trip off user-facing requests; the check in
+        _ensure_valid_token remains as a fallback. Skipped when no request is
+        due before the token expires, as it would only rotate the tokens; the
+        next request then refreshes on demand.
+        """
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if (
+            self._closed
+            or self._create_background_task is None
+            or self._request_interval is None
+            or self._token_expiry is None
+        ):
+            return
+        remaining = (self._token_expiry - datetime.now(UTC)).total_seconds()
+        if self._request_interval >= remaining:
+            return
+        delay = max(remaining - TOKEN_REFRESH_MARGIN, remaining / 2)
+        self._refresh_timer = asyncio.get_running_loop().call_later(
+            delay, self._start_token_refresh
+        )
+
+    def _start_token_refresh(self) -> None:
+        """Start the scheduled refresh as a background task."""
+        self._refresh_timer = None
+        self._refresh_task = self._create_background_task(
+            self._background_token_refresh(), "tado_x_token_refresh"
+        )
+
+    async def _background_token_refresh(self) -> None:
+        """Refresh the token, unless a request already did."""
+        try:
+            await self._refresh_token_if_current(self._access_token)
+        except (TadoXAuthError, asyncio.TimeoutError) as err:
+            # The next request retries the refresh inline and reports the error
+            _LOGGER.debug("Background token refresh failed: %s", err)
+
+    def close(self) -> None:
+        """Stop background work of this client, e.g. when its entry unloads.
+
+        Only a pending refresh is cancelled. One that already reached Tado may
+        have rotated the refresh token, see async_wait_for_token_refresh.
+        """
+        self._closed = True
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+    async def async_wait_for_token_refresh(self) -> None:
+        """Wait for a background token refresh that is talking to Tado."""
+        if self._refresh_task:
+            await asyncio.wait([self._refresh_task])
+
     async def _ensure_valid_token(self) -> None:
         """Ensure we have a valid access token."""
         if not self._access_token:
             raise TadoXAuthError("Not authenticated")
 
         # Refresh if token expires in less than 60 seconds
-        if self._token_expiry and datetime.now() >= self._token_expiry - timedelta(seconds=60):
-            await self.refresh_access_token()
+        if self._token_expiry and (
+            datetime.now(UTC) >= self._token_expiry - timedelta(seconds=60)
+        ):
+            await self._refresh_token_if_current(self._access_token)
+
+    async def _refresh_token_if_current(self, access_token: str | None) -> None:
+        """Refresh the token unless a concurrent request already replaced it.
+
+        Only one refresh runs at a time; requests that waited for it reuse its
+        result instead of spending the rotated refresh token again.
+        """
+        async with self._refresh_lock:
+            if self._access_token == access_token:
+                await self.refresh_access_token()
 
     async def _request(
         self,
@@ -327,72 +500,95 @@ class TadoXApi:
         url: str,
         json_data: dict | None = None,
     ) -> dict | list | None:
-        """Make an authenticated API request."""
+        """Make an authenticated API request.
+
+        Transient 429 responses are retried with jittered exponential backoff,
+        unless the daily quota is known to be used up.
+        """
         await self._ensure_valid_token()
 
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            try:
+                async with self._request_limiter:
+                    access_token = self._access_token
+                    status, result = await self._send(method, url, json_data)
+                    if status == 401:
+                        # Try to refresh token and retry once
+                        await self._refresh_token_if_current(access_token)
+                        status, result = await self._send(method, url, json_data)
+                break
+            except TadoXRateLimitError as err:
+                if attempt == RATE_LIMIT_RETRIES or self._api_quota_remaining == 0:
+                    # Rate limited - raise specific exception with reset time
+                    _LOGGER.warning(
+                        "Rate limit exceeded (429). Quota remaining: %s, Reset time: %s",
+                        self._api_quota_remaining,
+                        self._api_call_reset_time,
+                    )
+                    raise
+                delay = _jittered(err.retry_after or 2**attempt)
+                _LOGGER.debug("Rate limited (429), retrying %s %s in %.1fs", method, url, delay)
+                await asyncio.sleep(delay)
+            except aiohttp.ClientError as err:
+                raise TadoXApiError(f"Network error: {err}") from err
+
+        if status == 401:
+            raise TadoXApiError("API error: 401 - still unauthorized after token refresh")
+        return result
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        json_data: dict | None,
+    ) -> tuple[int, dict | list | None]:
+        """Perform a single HTTP attempt and return its status and body.
+
+        Every attempt is counted against the daily quota and updates the rate
+        limit info. A 401 is returned to the caller, which may retry after a
+        token refresh; other error statuses raise.
+        """
         # Track API call
         self._api_calls_today += 1
 
         # Reset counter if past reset time (noon UTC)
-        now = datetime.now(timezone.utc)
+        now = datetime.now(UTC)
         if now >= self._api_call_reset_time:
             self._api_calls_today = 1
             self._api_call_reset_time = self._calculate_next_reset_time(now)
 
-        headers = {
-            "Authorization": f"Bearer {self._access_token}",
-            "Content-Type": "application/json",
-        }
+        headers = {**_JSON_HEADERS, hdrs.AUTHORIZATION: f"Bearer {self._access_token}"}
 
-        try:
-            async with self._session.request(
-                method,
-                url,
-                headers=headers,
-                json=json_data,
-            ) as response:
-                # Parse rate limit headers from Tado API
-                self._parse_rate_limit_headers(response.headers)
-
-                if response.status == 401:
-                    # Try to refresh token and retry
-                    await self.refresh_access_token()
-                    headers["Authorization"] = f"Bearer {self._access_token}"
-                    async with self._session.request(
-                        method,
-                        url,
-                        headers=headers,
-                        json=json_data,
-                    ) as retry_response:
-                        if retry_response.status != 200:
-                            text = await retry_response.text()
-                            raise TadoXApiError(f"API error: {retry_response.status} - {text}")
-                        if retry_response.content_length == 0:
-                            return None
-                        return await retry_response.json()
-
-                if response.status == 429:
-                    # Rate limited - raise specific exception with reset time
-                    _LOGGER.warning(
-                        "Rate limit exceeded (429). Quota remaining: %s, Reset time: %s",
-                        self._api_quota_remaining,
-                        self._api_call_reset_time,
-                    )
-                    raise TadoXRateLimitError(
-                        "API rate limit exceeded (429). Please wait for quota reset.",
-                        reset_time=self._api_call_reset_time,
-                    )
+        async with self._session.request(
+            method,
+            url,
+            headers=headers,
+            data=_json_dumps(json_data) if json_data is not None else None,
+        ) as response:
+            # Parse rate limit headers from Tado API
+            self._parse_rate_limit_headers(response.headers)
 
-                if response.status not in (200, 204):
-                    text = await response.text()
-                    raise TadoXApiError(f"API error: {response.status} - {text}")
+            # Action endpoints answer without a body, skip all further checks
+            if response.status == 204:
+                return response.status, None
 
-                if response.content_length == 0 or response.status == 204:
-                    return None
-                return await response.json()
+            if response.status == 401:
+                return response.status, None
 
-        except aiohttp.ClientError as err:
-            raise TadoXApiError(f"Network error: {err}") from err
+            if response.status == 429:
+                raise TadoXRateLimitError(
+                    "API rate limit exceeded (429). Please wait for quota reset.",
+                    reset_time=self._api_call_reset_time,
+                    retry_after=_parse_retry_after(response.headers.get(hdrs.RETRY_AFTER)),
+                )
+
+            if response.status != 200:
+                text = await response.text()
+                raise TadoXApiError(f"API error: {response.status} - {text}")
+
+            if response.headers.get(hdrs.CONTENT_LENGTH) == "0":
+                return response.status, None
+            return response.status, await response.json(loads=_json_loads)
 
     # My Tado API endpoints (user info)
     async def get_me(self) -> dict[str, Any]:
@@ -408,16 +604,14 @@ class TadoXApi:
     # Hops Tado API endpoints (Tado X specific)
     async def get_rooms(self) -> list[dict[str, Any]]:
         """Get all rooms with current state."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
-        result = await self._request("GET", f"{TADO_HOPS_API_URL}/homes/{self._home_id}/rooms")
+        self._require_home_id()
+        result = await self._request("GET", f"{self._hops_home_url}/rooms")
         return result if isinstance(result, list) else []
 
     async def get_rooms_and_devices(self) -> dict[str, Any]:
         """Get all rooms with their devices."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
-        result = await self._request("GET", f"{TADO_HOPS_API_URL}/homes/{self._home_id}/roomsAndDevices")
+        self._require_home_id()
+        result = await self._request("GET", f"{self._hops_home_url}/roomsAndDevices")
         return result if isinstance(result, dict) else {}
 
     async def set_room_temperature(
@@ -425,12 +619,11 @@ class TadoXApi:
         room_id: int,
         temperature: float,
         power: str = "ON",
-        termination_type: str = "TIMER",
+        termination_type: str = Termination.TIMER,
         duration_seconds: int = 1800,
     ) -> None:
         """Set the temperature for a room."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         data: dict[str, Any] = {
             "setting": {
@@ -440,24 +633,23 @@ class TadoXApi:
             "termination": {"type": termination_type},
         }
 
-        if termination_type == "TIMER":
+        if termination_type == Termination.TIMER:
             data["termination"]["durationInSeconds"] = duration_seconds
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/rooms/{room_id}/manualControl",
+            f"{self._hops_home_url}/rooms/{room_id}/manualControl",
             json_data=data,
         )
 
     async def set_room_off(
         self,
         room_id: int,
-        termination_type: str = "TIMER",
+        termination_type: str = Termination.TIMER,
         duration_seconds: int = 1800,
     ) -> None:
         """Turn off heating for a room (frost protection mode)."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         data: dict[str, Any] = {
             "setting": {
@@ -466,14 +658,14 @@ class TadoXApi:
             "termination": {"type": termination_type},
         }
 
-        if termination_type == "TIMER":
+        if termination_type == Termination.TIMER:
             data["termination"]["durationInSeconds"] = duration_seconds
 
         _LOGGER.debug("Setting room %s to OFF with data: %s", room_id, data)
 
         result = await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/rooms/{room_id}/manualControl",
+            f"{self._hops_home_url}/rooms/{room_id}/manualControl",
             json_data=data,
         )
 
@@ -481,12 +673,11 @@ class TadoXApi:
 
     async def resume_schedule(self, room_id: int) -> None:
         """Resume the schedule for a room (cancel manual control)."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "DELETE",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/rooms/{room_id}/manualControl",
+            f"{self._hops_home_url}/rooms/{room_id}/manualControl",
         )
 
     async def set_boost_mode(self) -> None:
@@ -495,78 +686,71 @@ class TadoXApi:
         Note: Tado X API only supports home-wide boost, not per-room boost.
         To boost a single room, use set_room_temperature with max temperature.
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/quickActions/boost",
+            f"{self._hops_home_url}/quickActions/boost",
         )
 
     async def resume_all_schedules(self) -> None:
         """Resume schedule for all rooms."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/quickActions/resumeSchedule",
+            f"{self._hops_home_url}/quickActions/resumeSchedule",
         )
 
     async def set_open_window_detection(self, room_id: int, enabled: bool) -> None:
         """Enable or disable open window detection for a room."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         if enabled:
             await self._request(
                 "POST",
-                f"{TADO_HOPS_API_URL}/homes/{self._home_id}/rooms/{room_id}/openWindow",
+                f"{self._hops_home_url}/rooms/{room_id}/openWindow",
             )
         else:
             await self._request(
                 "DELETE",
-                f"{TADO_HOPS_API_URL}/homes/{self._home_id}/rooms/{room_id}/openWindow",
+                f"{self._hops_home_url}/rooms/{room_id}/openWindow",
             )
 
     # Presence/Geofencing endpoints (My Tado API)
     async def get_home_state(self) -> dict[str, Any]:
         """Get the current home presence state."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
-        result = await self._request("GET", f"{TADO_MY_API_URL}/homes/{self._home_id}/state")
+        self._require_home_id()
+        result = await self._request("GET", f"{self._my_home_url}/state")
         return result if isinstance(result, dict) else {}
 
     async def set_presence_home(self) -> None:
         """Set presence to HOME (override geofencing)."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "PUT",
-            f"{TADO_MY_API_URL}/homes/{self._home_id}/presenceLock",
+            f"{self._my_home_url}/presenceLock",
             json_data={"homePresence": "HOME"},
         )
 
     async def set_presence_away(self) -> None:
         """Set presence to AWAY (override geofencing)."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "PUT",
-            f"{TADO_MY_API_URL}/homes/{self._home_id}/presenceLock",
+            f"{self._my_home_url}/presenceLock",
             json_data={"homePresence": "AWAY"},
         )
 
     async def set_presence_auto(self) -> None:
         """Enable automatic geofencing (remove presence lock)."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "DELETE",
-            f"{TADO_MY_API_URL}/homes/{self._home_id}/presenceLock",
+            f"{self._my_home_url}/presenceLock",
         )
 
     # Device configuration endpoints
@@ -577,12 +761,11 @@ class TadoXApi:
             device_serial: Serial number of the device
             offset: Temperature offset in °C (typically -9.9 to +9.9)
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "PATCH",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/roomsAndDevices/devices/{device_serial}",
+            f"{self._hops_home_url}/roomsAndDevices/devices/{device_serial}",
             json_data={"temperatureOffset": offset},
         )
 
@@ -593,8 +776,7 @@ class TadoXApi:
             reading: Integer meter reading value
             date: Date in YYYY-MM-DD format (defaults to today)
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         from datetime import date as date_module
 
@@ -602,7 +784,7 @@ class TadoXApi:
 
         await self._request(
             "POST",
-            f"{TADO_EIQ_API_URL}/homes/{self._home_id}/meterReadings",
+            f"{self._eiq_home_url}/meterReadings",
             json_data={"date": reading_date, "reading": reading},
         )
 
@@ -613,55 +795,50 @@ class TadoXApi:
             device_serial: Serial number of the device
             enabled: True to enable child lock, False to disable
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "PATCH",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/roomsAndDevices/devices/{device_serial}",
+            f"{self._hops_home_url}/roomsAndDevices/devices/{device_serial}",
             json_data={"childLockEnabled": enabled},
         )
 
     # Quick Actions
     async def boost_all_heating(self) -> None:
         """Boost heating in all rooms."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/quickActions/boost",
+            f"{self._hops_home_url}/quickActions/boost",
         )
 
     async def disable_all_heating(self) -> None:
         """Turn off heating in all rooms."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/quickActions/allOff",
+            f"{self._hops_home_url}/quickActions/allOff",
         )
 
     async def resume_all_schedules(self) -> None:
         """Resume smart schedule in all rooms."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/quickActions/resumeSchedule",
+            f"{self._hops_home_url}/quickActions/resumeSchedule",
         )
 
     # Energy IQ Tariffs
     async def get_eiq_tariffs(self) -> list[dict]:
         """Get Energy IQ tariff history."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         result = await self._request(
             "GET",
-            f"{TADO_EIQ_API_URL}/homes/{self._home_id}/tariffs",
+            f"{self._eiq_home_url}/tariffs",
         )
         return result if isinstance(result, list) else []
 
@@ -680,8 +857,7 @@ class TadoXApi:
             start_date: Start date (YYYY-MM-DD), defaults to today
             end_date: End date (YYYY-MM-DD), optional for ongoing tariff
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         from datetime import date as date_module
 
@@ -697,7 +873,7 @@ class TadoXApi:
 
         await self._request(
             "POST",
-            f"{TADO_EIQ_API_URL}/homes/{self._home_id}/tariffs",
+            f"{self._eiq_home_url}/tariffs",
             json_data=payload,
         )
 
@@ -707,12 +883,11 @@ class TadoXApi:
         Args:
             tariff_id: ID of the tariff to delete
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "DELETE",
-            f"{TADO_EIQ_API_URL}/homes/{self._home_id}/tariffs/{tariff_id}",
+            f"{self._eiq_home_url}/tariffs/{tariff_id}",
         )
 
     async def get_weather(self) -> dict[str, Any]:
@@ -721,26 +896,52 @@ class TadoXApi:
         Returns weather information including outdoor temperature,
         solar intensity, and weather state.
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         result = await self._request(
             "GET",
-            f"{TADO_MY_API_URL}/homes/{self._home_id}/weather",
+            f"{self._my_home_url}/weather",
         )
         return result if isinstance(result, dict) else {}
 
+    # Coordinator refresh
+    async def fetch_refresh_bundle(
+        self,
+        include_weather: bool = True,
+        include_mobile_devices: bool = True,
+    ) -> dict[str, Any]:
+        """Fetch the independent data of one coordinator refresh concurrently.
+
+        Returns a dict with rooms, rooms_devices, home_state and, when
+        included, weather and mobile_devices. If any request fails, the first
+        error is raised once all requests have finished.
+        """
+        requests = {
+            "rooms": self.get_rooms(),
+            "rooms_devices": self.get_rooms_and_devices(),
+            "home_state": self.get_home_state(),
+        }
+        if include_weather:
+            requests["weather"] = self.get_weather()
+        if include_mobile_devices:
+            requests["mobile_devices"] = self.get_mobile_devices()
+
+        results = await asyncio.gather(*requests.values(), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return dict(zip(requests, results))
+
     # Mobile Devices endpoints
     async def get_mobile_devices(self) -> list[dict[str, Any]]:
         """Get all mobile devices registered for geofencing.
 
         Returns a list of mobile device dicts with location and geofencing info.
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
         result = await self._request(
             "GET",
-            f"{TADO_MY_API_URL}/homes/{self._home_id}/mobileDevices",
+            f"{self._my_home_url}/mobileDevices",
         )
         return result if isinstance(result, list) else []
 
@@ -749,12 +950,11 @@ class TadoXApi:
 
         Returns air freshness and comfort levels per room.
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         result = await self._request(
             "GET",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/airComfort",
+            f"{self._hops_home_url}/airComfort",
         )
         return result if isinstance(result, dict) else {}
 
@@ -788,12 +988,11 @@ class TadoXApi:
                 }
             }
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         result = await self._request(
             "GET",
-            f"{TADO_MINDER_API_URL}/homes/{self._home_id}/runningTimes?from={from_date}&to={to_date}",
+            f"{self._minder_home_url}/runningTimes?from={from_date}&to={to_date}",
         )
         return result if isinstance(result, dict) else {}
 
@@ -817,12 +1016,11 @@ class TadoXApi:
                 }
             }
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         result = await self._request(
             "GET",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/settings/flowTemperatureOptimization",
+            f"{self._hops_home_url}/settings/flowTemperatureOptimization",
         )
         return result if isinstance(result, dict) else {}
 
@@ -832,12 +1030,11 @@ class TadoXApi:
         Args:
             temperature: Temperature in °C (typically 20-75, depends on constraints)
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "PATCH",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/settings/flowTemperatureOptimization",
+            f"{self._hops_home_url}/settings/flowTemperatureOptimization",
             json_data={"maxFlowTemperature": temperature},
         )
 
@@ -847,12 +1044,11 @@ class TadoXApi:
         Args:
             enabled: True to enable auto-adaptation, False to disable
         """
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "PATCH",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/settings/flowTemperatureOptimization",
+            f"{self._hops_home_url}/settings/flowTemperatureOptimization",
             json_data={"autoAdaptation": {"enabled": enabled}},
         )
     # ------------------------------------------------------------------
@@ -861,42 +1057,38 @@ class TadoXApi:
 
     async def dhw_on(self) -> None:
         """Enable domestic hot water (remove OFF state)."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "DELETE",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/heatPump/domesticHotWater/off",
+            f"{self._hops_home_url}/heatPump/domesticHotWater/off",
         )
 
     async def dhw_off(self) -> None:
         """Disable domestic hot water (set OFF state)."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/heatPump/domesticHotWater/off",
+            f"{self._hops_home_url}/heatPump/domesticHotWater/off",
         )
 
     async def dhw_boost(self) -> None:
         """Activate domestic hot water boost."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         await self._request(
             "POST",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/heatPump/domesticHotWater/boost",
+            f"{self._hops_home_url}/heatPump/domesticHotWater/boost",
         )
 
     async def get_dhw_state(self) -> dict[str, Any]:
         """Get current domestic hot water state."""
-        if not self._home_id:
-            raise TadoXApiError("Home ID not set")
+        self._require_home_id()
 
         result = await self._request(
             "GET",
-            f"{TADO_HOPS_API_URL}/homes/{self._home_id}/heatPump/domesticHotWater",
+            f"{self._hops_home_url}/heatPump/domesticHotWater",
         )
 
         return result if isinstance(result, dict) else {}
@@ -10,14 +10,13 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import TadoXDataUpdateCoordinator, TadoXDevice, TadoXRoom
+from .coordinator import TadoXConfigEntry, TadoXDataUpdateCoordinator, TadoXDevice, TadoXRoom
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -75,11 +74,11 @@ DEVICE_BINARY_SENSORS: tuple[TadoXDeviceBinarySensorEntityDescription, ...] = (
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: TadoXConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Tado X binary sensor entities."""
-    coordinator: TadoXDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     entities: list[BinarySensorEntity] = []
 
@@ -116,6 +115,8 @@ class TadoXRoomBinarySensor(CoordinatorEntity[TadoXDataUpdateCoordinator], Binar
         self._room_id = room_id
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.home_id}_{room_id}_{description.key}"
+        self._identifiers = {(DOMAIN, f"{coordinator.home_id}_{room_id}")}
+        self._via_device = (DOMAIN, str(coordinator.home_id))
 
     @property
     def _room(self) -> TadoXRoom | None:
@@ -129,11 +130,11 @@ class TadoXRoomBinarySensor(CoordinatorEntity[TadoXDataUpdateCoordinator], Binar
         room_name = room.name if room else f"Room {self._room_id}"
 
         return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.coordinator.home_id}_{self._room_id}")},
+            identifiers=self._identifiers,
             name=room_name,
             manufacturer="Tado",
             model="Tado X Room",
-            via_device=(DOMAIN, str(self.coordinator.home_id)),
+            via_device=self._via_device,
         )
 
     @property
@@ -167,6 +168,7 @@ class TadoXDeviceBinarySensor(CoordinatorEntity[TadoXDataUpdateCoordinator], Bin
         self._serial_number = serial_number
         self.entity_description = description
         self._attr_unique_id = f"{serial_number}_{description.key}"
+        self._attr_device_info = coordinator.build_device_info(serial_number)
         # Simple name without serial suffix - device name already has it
 
     @property
@@ -174,70 +176,6 @@ class TadoXDeviceBinarySensor(CoordinatorEntity[TadoXDataUpdateCoordinator], Bin
         """Get the device data."""
         return self.coordinator.data.devices.get(self._serial_number)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        device = self._device
-        if not device:
-            return DeviceInfo(
-                identifiers={(DOMAIN, self._serial_number)},
-            )
-
-        # French names for device types (used in device name)
-        device_type_names_fr = {
-            "VA04": "Vanne",
-            "SU04": "Capteur Temp",
-            "TR04": "Récepteur",  # Wireless Receiver X
-            "RU04": "Thermostat",  # Wired Smart Thermostat X
-            "IB02": "Bridge X",
-        }
-
-        # English model names (used in device model field)
-        device_type_models = {
-            "VA04": "Radiator Valve X",
-            "SU04": "Temperature Sensor X",
-            "TR04": "Wireless Receiver X",
-            "RU04": "Wired Smart Thermostat X",
-            "IB02": "Bridge X",
-        }
-
-        # Determine via_device - link to room if device has one, otherwise to home
-        via_device_id = (
-            (DOMAIN, f"{self.coordinator.home_id}_{device.room_id}")
-            if device.room_id
-            else (DOMAIN, str(self.coordinator.home_id))
-        )
-
-        # Generate device name with room name and numbering
-        base_name = device_type_names_fr.get(device.device_type, device.device_type)
-
-        if device.room_id and device.room_name:
-            # Count devices of same type in same room to determine numbering
-            same_type_in_room = sorted([
-                d.serial_number for d in self.coordinator.data.devices.values()
-                if d.room_id == device.room_id and d.device_type == device.device_type
-            ])
-
-            if len(same_type_in_room) > 1:
-                # Multiple devices of same type - add number
-                device_number = same_type_in_room.index(self._serial_number) + 1
-                device_name = f"{base_name} {device_number} - {device.room_name}"
-            else:
-                # Only one device of this type - no number needed
-                device_name = f"{base_name} - {device.room_name}"
-        else:
-            # No room - use serial number suffix (e.g., Bridge)
-            device_name = f"{base_name} ({self._serial_number[-4:]})"
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._serial_number)},
-            name=device_name,
-            manufacturer="Tado",
-            model=device_type_models.get(device.device_type, device.device_type),
-            sw_version=device.firmware_version,
-            via_device=via_device_id,
-        )
-
     @property
     def is_on(self) -> bool | None:
         """Return the binary sensor state."""
@@ -6,14 +6,13 @@ from dataclasses import dataclass
 from collections.abc import Awaitable, Callable
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import TadoXDataUpdateCoordinator
+from .coordinator import TadoXConfigEntry, TadoXDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,11 +55,11 @@ BUTTON_DESCRIPTIONS: tuple[TadoXButtonEntityDescription, ...] = (
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: TadoXConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Tado X button entities."""
-    coordinator: TadoXDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     entities = [
         TadoXButton(coordinator, description)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -10,7 +11,6 @@ from homeassistant.components.climate import (
     HVACAction,
     HVACMode,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
@@ -26,7 +26,7 @@ from .const import (
     TERMINATION_MANUAL,
     TERMINATION_TIMER,
 )
-from .coordinator import TadoXDataUpdateCoordinator, TadoXRoom
+from .coordinator import TadoXConfigEntry, TadoXDataUpdateCoordinator, TadoXRoom
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,11 +38,11 @@ PRESET_SCHEDULE = "schedule"
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: TadoXConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Tado X climate entities."""
-    coordinator: TadoXDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     entities = []
     for room_id, room in coordinator.data.rooms.items():
@@ -79,19 +79,26 @@ class TadoXClimate(CoordinatorEntity[TadoXDataUpdateCoordinator], ClimateEntity)
         super().__init__(coordinator)
         self._room_id = room_id
         self._attr_unique_id = f"{coordinator.home_id}_{room_id}_climate"
+        self._cached_room: TadoXRoom | None = coordinator.data.rooms.get(room_id)
+        self._room_name: str | None = None
+        self._update_device_info()
+        self._update_available()
+        # Inputs of the last written state, to skip writes without changes
+        self._last_snapshot: tuple[Any, ...] | None = None
 
     @property
     def _room(self) -> TadoXRoom | None:
-        """Get the room data."""
-        return self.coordinator.data.rooms.get(self._room_id)
+        """Get the room data, as of the last coordinator update."""
+        return self._cached_room
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
+    def _update_device_info(self) -> None:
+        """Build the device info, only when the room name has changed."""
         room = self._room
         room_name = room.name if room else f"Room {self._room_id}"
-
-        return DeviceInfo(
+        if room_name == self._room_name:
+            return
+        self._room_name = room_name
+        self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, f"{self.coordinator.home_id}_{self._room_id}")},
             name=room_name,
             manufacturer="Tado",
@@ -101,11 +108,16 @@ class TadoXClimate(CoordinatorEntity[TadoXDataUpdateCoordinator], ClimateEntity)
 
     @property
     def available(self) -> bool:
-        """Return if entity is available."""
+        """Return if entity is available (computed on coordinator update).
+
+        Overridden because CoordinatorEntity.available ignores _attr_available.
+        """
+        return self._attr_available
+
+    def _update_available(self) -> None:
+        """Set availability from the room's connection state."""
         room = self._room
-        if not room:
-            return False
-        return room.connection_state == "CONNECTED"
+        self._attr_available = room is not None and room.connection_state == "CONNECTED"
 
     @property
     def current_temperature(self) -> float | None:
@@ -265,6 +277,16 @@ class TadoXClimate(CoordinatorEntity[TadoXDataUpdateCoordinator], ClimateEntity)
             termination_type=TERMINATION_TIMER,
             duration_seconds=DEFAULT_TIMER_DURATION,
         )
+
+        # Show the new setpoint right away, the refresh below is debounced so a
+        # slider drag does not poll the API for every step
+        if self._cached_room is not None:
+            self._cached_room = replace(self._cached_room, target_temperature=temperature)
+            # The written state no longer matches the last snapshot, so the
+            # next update writes even if the server room did not change
+            self._last_snapshot = None
+            self.async_write_ha_state()
+
         await self.coordinator.async_request_refresh()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
@@ -304,5 +326,18 @@ class TadoXClimate(CoordinatorEntity[TadoXDataUpdateCoordinator], ClimateEntity)
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
+        """Handle updated data from the coordinator.
+
+        The state is only written when something it is derived from changed;
+        rooms are fresh dataclasses per refresh, so they compare by value.
+        """
+        data = self.coordinator.data
+        self._cached_room = data.rooms.get(self._room_id)
+        self._update_device_info()
+        self._update_available()
+
+        snapshot = (self._cached_room, data.presence, data.presence_locked, self._attr_available)
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
         self.async_write_ha_state()
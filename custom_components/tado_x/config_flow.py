@@ -8,18 +8,18 @@ from typing import Any
 import aiohttp
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult, OptionsFlow
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import TadoXApi, TadoXAuthError
 from .const import (
     CONF_ACCESS_TOKEN,
-    CONF_ENABLE_AIR_COMFORT,
-    CONF_ENABLE_FLOW_TEMP,
-    CONF_ENABLE_MOBILE_DEVICES,
-    CONF_ENABLE_RUNNING_TIMES,
-    CONF_ENABLE_WEATHER,
     CONF_HAS_AUTO_ASSIST,
     CONF_HOME_ID,
     CONF_HOME_NAME,
@@ -27,12 +27,28 @@ from .const import (
     CONF_SCAN_INTERVAL,
     CONF_TOKEN_EXPIRY,
     DOMAIN,
+    FEATURE_FLAGS,
+    POLL_INTERVAL,
+    POLL_TIMEOUT,
     SCAN_INTERVAL_AUTO_ASSIST,
     SCAN_INTERVAL_FREE_TIER,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Validators are built once, only the option defaults differ per form
+_EMPTY_SCHEMA = vol.Schema({})
+_SCAN_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=30, max=3600))
+
+
+def _token_data(api: TadoXApi) -> dict[str, Any]:
+    """Return the config entry data for the tokens of an authorized client."""
+    return {
+        CONF_ACCESS_TOKEN: api.access_token,
+        CONF_REFRESH_TOKEN: api.refresh_token,
+        CONF_TOKEN_EXPIRY: (expiry := api.token_expiry) and expiry.isoformat(),
+    }
+
 
 class TadoXConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Tado X."""
@@ -51,8 +67,18 @@ class TadoXConfigFlow(ConfigFlow, domain=DOMAIN):
         self._device_code: str | None = None
         self._user_code: str | None = None
         self._verification_uri: str | None = None
+        self._poll_interval: float = POLL_INTERVAL
+        self._poll_timeout: float = POLL_TIMEOUT
         self._poll_task: asyncio.Task | None = None
         self._homes: list[dict[str, Any]] = []
+        self._homes_by_id: dict[Any, dict[str, Any]] = {}
+        self._home_options: dict[Any, str] = {}
+
+    def _ensure_api(self) -> TadoXApi:
+        """Return the flow's API client on Home Assistant's shared session."""
+        if self._api is None:
+            self._api = TadoXApi(async_get_clientsession(self.hass))
+        return self._api
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -62,13 +88,13 @@ class TadoXConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             # User clicked "Start Authentication"
-            session = async_get_clientsession(self.hass)
-            self._api = TadoXApi(session)
-
             try:
-                auth_data = await self._api.start_device_auth()
+                auth_data = await self._ensure_api().start_device_auth()
                 self._device_code = auth_data["device_code"]
                 self._user_code = auth_data["user_code"]
+                self._poll_interval = auth_data.get("interval", POLL_INTERVAL)
+                # Polling blocks the form submit, so never wait past the old limit
+                self._poll_timeout = min(auth_data.get("expires_in", POLL_TIMEOUT), POLL_TIMEOUT)
                 self._verification_uri = auth_data.get(
                     "verification_uri_complete",
                     auth_data.get("verification_uri", "https://login.tado.com/oauth2/device")
@@ -84,7 +110,7 @@ class TadoXConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({}),
+            data_schema=_EMPTY_SCHEMA,
             errors=errors,
             description_placeholders={
                 "info": "Click 'Submit' to start the authentication process with Tado."
@@ -103,15 +129,20 @@ class TadoXConfigFlow(ConfigFlow, domain=DOMAIN):
                 try:
                     # Poll for token - give enough time for user to authorize
                     success = await self._api.poll_for_token(
-                        self._device_code, interval=3, timeout=120
+                        self._device_code,
+                        interval=self._poll_interval,
+                        timeout=self._poll_timeout,
                     )
                     if success:
-                        # Get homes
-                        self._homes = await self._api.get_homes()
+                        # Get homes, once per flow
+                        if not self._homes:
+                            self._homes = await self._api.get_homes()
+                            self._homes_by_id = {home["id"]: home for home in self._homes}
+                            self._home_options = {home["id"]: home["name"] for home in self._homes}
                         if len(self._homes) == 1:
                             # Only one home, use it directly
                             home = self._homes[0]
-                            return self._create_entry(home)
+                            return await self._create_entry(home)
                         elif len(self._homes) > 1:
                             # Multiple homes, let user choose
                             return await self.async_step_select_home()
@@ -126,7 +157,7 @@ class TadoXConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="auth",
-            data_schema=vol.Schema({}),
+            data_schema=_EMPTY_SCHEMA,
             errors=errors,
             description_placeholders={
                 "user_code": self._user_code or "",
@@ -139,41 +170,34 @@ class TadoXConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> ConfigFlowResult:
         """Handle home selection when multiple homes exist."""
         if user_input is not None:
-            home_id = user_input[CONF_HOME_ID]
-            for home in self._homes:
-                if home["id"] == home_id:
-                    return self._create_entry(home)
-
-        home_options = {home["id"]: home["name"] for home in self._homes}
+            home = self._homes_by_id.get(user_input[CONF_HOME_ID])
+            if home:
+                return await self._create_entry(home)
 
         return self.async_show_form(
             step_id="select_home",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_HOME_ID): vol.In(home_options),
+                    vol.Required(CONF_HOME_ID): vol.In(self._home_options),
                 }
             ),
         )
 
-    def _create_entry(self, home: dict[str, Any]) -> ConfigFlowResult:
+    async def _create_entry(self, home: dict[str, Any]) -> ConfigFlowResult:
         """Create the config entry."""
         if not self._api:
             return self.async_abort(reason="unknown")
 
-        # Check if this home is already configured
-        await_unique_id = f"tado_x_{home['id']}"
-        for entry in self._async_current_entries():
-            if entry.unique_id == await_unique_id:
-                return self.async_abort(reason="already_configured")
+        # Abort if this home is already configured
+        await self.async_set_unique_id(f"tado_x_{home['id']}")
+        self._abort_if_unique_id_configured()
 
         return self.async_create_entry(
             title=home["name"],
             data={
                 CONF_HOME_ID: home["id"],
                 CONF_HOME_NAME: home["name"],
-                CONF_ACCESS_TOKEN: self._api.access_token,
-                CONF_REFRESH_TOKEN: self._api.refresh_token,
-                CONF_TOKEN_EXPIRY: self._api.token_expiry.isoformat() if self._api.token_expiry else None,
+                **_token_data(self._api),
             },
         )
 
@@ -190,13 +214,13 @@ class TadoXConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            session = async_get_clientsession(self.hass)
-            self._api = TadoXApi(session)
-
             try:
-                auth_data = await self._api.start_device_auth()
+                auth_data = await self._ensure_api().start_device_auth()
                 self._device_code = auth_data["device_code"]
                 self._user_code = auth_data["user_code"]
+                self._poll_interval = auth_data.get("interval", POLL_INTERVAL)
+                # Polling blocks the form submit, so never wait past the old limit
+                self._poll_timeout = min(auth_data.get("expires_in", POLL_TIMEOUT), POLL_TIMEOUT)
                 self._verification_uri = auth_data.get(
                     "verification_uri_complete",
                     auth_data.get("verification_uri")
@@ -209,7 +233,7 @@ class TadoXConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema({}),
+            data_schema=_EMPTY_SCHEMA,
             errors=errors,
         )
 
@@ -223,7 +247,9 @@ class TadoXConfigFlow(ConfigFlow, domain=DOMAIN):
             if self._api and self._device_code:
                 try:
                     success = await self._api.poll_for_token(
-                        self._device_code, interval=3, timeout=120
+                        self._device_code,
+                        interval=self._poll_interval,
+                        timeout=self._poll_timeout,
                     )
                     if success:
                         # Update the existing entry
@@ -232,9 +258,7 @@ class TadoXConfigFlow(ConfigFlow, domain=DOMAIN):
                             reauth_entry,
                             data={
                                 **reauth_entry.data,
-                                CONF_ACCESS_TOKEN: self._api.access_token,
-                                CONF_REFRESH_TOKEN: self._api.refresh_token,
-                                CONF_TOKEN_EXPIRY: self._api.token_expiry.isoformat() if self._api.token_expiry else None,
+                                **_token_data(self._api),
                             },
                         )
                     else:
@@ -246,7 +270,7 @@ class TadoXConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_auth",
-            data_schema=vol.Schema({}),
+            data_schema=_EMPTY_SCHEMA,
             errors=errors,
             description_placeholders={
                 "user_code": self._user_code or "",
@@ -267,11 +291,7 @@ class TadoXOptionsFlow(OptionsFlow):
             custom_interval = user_input.get(CONF_SCAN_INTERVAL)
 
             # Get feature toggles
-            enable_weather = user_input.get(CONF_ENABLE_WEATHER, has_auto_assist)
-            enable_mobile_devices = user_input.get(CONF_ENABLE_MOBILE_DEVICES, has_auto_assist)
-            enable_air_comfort = user_input.get(CONF_ENABLE_AIR_COMFORT, has_auto_assist)
-            enable_running_times = user_input.get(CONF_ENABLE_RUNNING_TIMES, has_auto_assist)
-            enable_flow_temp = user_input.get(CONF_ENABLE_FLOW_TEMP, has_auto_assist)
+            features = {key: user_input.get(key, has_auto_assist) for key in FEATURE_FLAGS}
 
             # Determine scan interval: custom if set, otherwise based on tier
             if custom_interval and custom_interval > 0:
@@ -282,34 +302,19 @@ class TadoXOptionsFlow(OptionsFlow):
                     else SCAN_INTERVAL_FREE_TIER
                 )
 
-            # Update the config entry data
+            # Update the config entry data; the update listener reloads the entry,
+            # so the coordinator and the loaded platforms follow the new options
             new_data = {
                 **self.config_entry.data,
                 CONF_HAS_AUTO_ASSIST: has_auto_assist,
                 CONF_SCAN_INTERVAL: scan_interval,
-                CONF_ENABLE_WEATHER: enable_weather,
-                CONF_ENABLE_MOBILE_DEVICES: enable_mobile_devices,
-                CONF_ENABLE_AIR_COMFORT: enable_air_comfort,
-                CONF_ENABLE_RUNNING_TIMES: enable_running_times,
-                CONF_ENABLE_FLOW_TEMP: enable_flow_temp,
+                **features,
             }
             self.hass.config_entries.async_update_entry(
                 self.config_entry,
                 data=new_data,
             )
 
-            # Update the coordinator if it exists
-            if self.config_entry.entry_id in self.hass.data.get(DOMAIN, {}):
-                coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id]
-                coordinator.api.has_auto_assist = has_auto_assist
-                coordinator.update_scan_interval(scan_interval)
-                # Update feature flags
-                coordinator.enable_weather = enable_weather
-                coordinator.enable_mobile_devices = enable_mobile_devices
-                coordinator.enable_air_comfort = enable_air_comfort
-                coordinator.enable_running_times = enable_running_times
-                coordinator.enable_flow_temp = enable_flow_temp
-
             return self.async_create_entry(title="", data={})
 
         current_auto_assist = self.config_entry.data.get(CONF_HAS_AUTO_ASSIST, False)
@@ -317,12 +322,9 @@ class TadoXOptionsFlow(OptionsFlow):
 
         # Feature toggles - default to True for Auto-Assist, False for free tier
         # If already configured, use the stored value
-        default_features = current_auto_assist
-        current_enable_weather = self.config_entry.data.get(CONF_ENABLE_WEATHER, default_features)
-        current_enable_mobile_devices = self.config_entry.data.get(CONF_ENABLE_MOBILE_DEVICES, default_features)
-        current_enable_air_comfort = self.config_entry.data.get(CONF_ENABLE_AIR_COMFORT, default_features)
-        current_enable_running_times = self.config_entry.data.get(CONF_ENABLE_RUNNING_TIMES, default_features)
-        current_enable_flow_temp = self.config_entry.data.get(CONF_ENABLE_FLOW_TEMP, default_features)
+        current_features = {
+            key: self.config_entry.data.get(key, current_auto_assist) for key in FEATURE_FLAGS
+        }
 
         # Suggested intervals based on tier
         default_interval = (
@@ -341,27 +343,11 @@ class TadoXOptionsFlow(OptionsFlow):
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
                         default=current_interval if current_interval > 0 else default_interval,
-                    ): vol.All(vol.Coerce(int), vol.Range(min=30, max=3600)),
-                    vol.Required(
-                        CONF_ENABLE_WEATHER,
-                        default=current_enable_weather,
-                    ): bool,
-                    vol.Required(
-                        CONF_ENABLE_MOBILE_DEVICES,
-                        default=current_enable_mobile_devices,
-                    ): bool,
-                    vol.Required(
-                        CONF_ENABLE_AIR_COMFORT,
-                        default=current_enable_air_comfort,
-                    ): bool,
-                    vol.Required(
-                        CONF_ENABLE_RUNNING_TIMES,
-                        default=current_enable_running_times,
-                    ): bool,
-                    vol.Required(
-                        CONF_ENABLE_FLOW_TEMP,
-                        default=current_enable_flow_temp,
-                    ): bool,
+                    ): _SCAN_INTERVAL_VALIDATOR,
+                    **{
+                        vol.Required(key, default=enabled): bool
+                        for key, enabled in current_features.items()
+                    },
                 }
             ),
         )
@@ -1,6 +1,9 @@
 """Constants for the Tado X integration."""
+from enum import StrEnum
 from typing import Final
 
+from homeassistant.const import Platform
+
 DOMAIN: Final = "tado_x"
 
 # API URLs
@@ -30,9 +33,22 @@ SCAN_INTERVAL_FREE_TIER: Final = 2700  # 45 minutes - stays under 100 req/day qu
 SCAN_INTERVAL_AUTO_ASSIST: Final = 30  # 30 seconds - for 20k req/day quota
 DEFAULT_SCAN_INTERVAL: Final = 30  # seconds (legacy, use tier-specific)
 
+# Device authorization polling (in seconds), used when the server sends no values
+POLL_INTERVAL: Final = 5
+POLL_TIMEOUT: Final = 120
+POLL_INTERVAL_BUFFER: Final = 1.2  # safety margin on the server interval against clock drift
+POLL_SLOW_DOWN_STEP: Final = 5  # RFC 8628 slow_down increment
+POLL_MAX_INTERVAL: Final = 10  # slow_down never backs off past this or twice the interval
+
+# Refresh access tokens this many seconds before they expire
+TOKEN_REFRESH_MARGIN: Final = 120
+
 # API Rate Limits
 API_QUOTA_FREE_TIER: Final = 100  # requests per day without Auto-Assist
 API_QUOTA_PREMIUM: Final = 20000  # requests per day with Auto-Assist
+API_MAX_CONCURRENT_REQUESTS: Final = 10  # in-flight requests to Tado across all homes
+RATE_LIMIT_RETRIES: Final = 3  # retries of a 429 response (1s, 2s, 4s plus jitter)
+RATE_LIMIT_MAX_RETRY_AFTER: Final = 30  # seconds, caps a server-provided Retry-After
 API_CALLS_PER_UPDATE: Final = 6  # get_rooms + get_rooms_and_devices + get_home_state + get_weather + get_mobile_devices + get_running_times
 
 # Config keys for options
@@ -45,20 +61,67 @@ CONF_ENABLE_AIR_COMFORT: Final = "enable_air_comfort"
 CONF_ENABLE_RUNNING_TIMES: Final = "enable_running_times"
 CONF_ENABLE_FLOW_TEMP: Final = "enable_flow_temp"
 
+# All feature toggles; each matches the coordinator attribute of the same name
+FEATURE_FLAGS: Final = (
+    CONF_ENABLE_WEATHER,
+    CONF_ENABLE_MOBILE_DEVICES,
+    CONF_ENABLE_AIR_COMFORT,
+    CONF_ENABLE_RUNNING_TIMES,
+    CONF_ENABLE_FLOW_TEMP,
+)
+
 # Base API calls (required): get_rooms, get_rooms_and_devices, get_home_state
 API_CALLS_BASE: Final = 3
 
+
+class DeviceType(StrEnum):
+    """Tado X device types."""
+
+    VALVE = "VA04"  # Tado X Radiator Valve
+    WIRELESS_RECEIVER = "TR04"  # Tado X Wireless Receiver
+    THERMOSTAT = "RU04"  # Tado X Wired Smart Thermostat
+    BRIDGE = "IB02"  # Tado X Bridge
+    SENSOR = "SU04"  # Tado X Temperature Sensor
+    HEAT_PUMP_OPTIMIZER = "CK04"  # Tado X Heat Pump Optimizer
+
+
+class Termination(StrEnum):
+    """Manual control termination types."""
+
+    MANUAL = "MANUAL"
+    TIMER = "TIMER"
+    NEXT_TIME_BLOCK = "NEXT_TIME_BLOCK"
+
+
 # Device types
-DEVICE_TYPE_VALVE: Final = "VA04"  # Tado X Radiator Valve
-DEVICE_TYPE_WIRELESS_RECEIVER: Final = "TR04"  # Tado X Wireless Receiver
-DEVICE_TYPE_THERMOSTAT: Final = "RU04"  # Tado X Wired Smart Thermostat
-DEVICE_TYPE_BRIDGE: Final = "IB02"  # Tado X Bridge
-DEVICE_TYPE_SENSOR: Final = "SU04"  # Tado X Temperature Sensor
+DEVICE_TYPE_VALVE: Final = DeviceType.VALVE
+DEVICE_TYPE_WIRELESS_RECEIVER: Final = DeviceType.WIRELESS_RECEIVER
+DEVICE_TYPE_THERMOSTAT: Final = DeviceType.THERMOSTAT
+DEVICE_TYPE_BRIDGE: Final = DeviceType.BRIDGE
+DEVICE_TYPE_SENSOR: Final = DeviceType.SENSOR
+
+# French device type names (used in device names)
+DEVICE_TYPE_NAMES_FR: Final[dict[str, str]] = {
+    DeviceType.VALVE: "Vanne",
+    DeviceType.SENSOR: "Capteur Temp",
+    DeviceType.WIRELESS_RECEIVER: "Récepteur",
+    DeviceType.THERMOSTAT: "Thermostat",
+    DeviceType.BRIDGE: "Bridge X",
+}
+
+# English model names (used in the device model field)
+DEVICE_TYPE_MODELS: Final[dict[str, str]] = {
+    DeviceType.VALVE: "Radiator Valve X",
+    DeviceType.SENSOR: "Temperature Sensor X",
+    DeviceType.WIRELESS_RECEIVER: "Wireless Receiver X",
+    DeviceType.THERMOSTAT: "Wired Smart Thermostat X",
+    DeviceType.BRIDGE: "Bridge X",
+}
 
 # Termination types
-TERMINATION_MANUAL: Final = "MANUAL"
-TERMINATION_TIMER: Final = "TIMER"
-TERMINATION_NEXT_TIME_BLOCK: Final = "NEXT_TIME_BLOCK"
+TERMINATION_MANUAL: Final = Termination.MANUAL
+TERMINATION_TIMER: Final = Termination.TIMER
+TERMINATION_NEXT_TIME_BLOCK: Final = Termination.NEXT_TIME_BLOCK
 
 # Default timer duration (30 minutes)
 DEFAULT_TIMER_DURATION: Final = 1800
@@ -77,4 +140,20 @@ CONNECTION_STATE_CONNECTED: Final = "CONNECTED"
 CONNECTION_STATE_DISCONNECTED: Final = "DISCONNECTED"
 
 # Platforms
-PLATFORMS: Final = ["climate", "sensor", "binary_sensor", "switch", "button", "device_tracker", "select", "number"]
+PLATFORMS: Final[tuple[Platform, ...]] = (
+    Platform.CLIMATE,
+    Platform.SENSOR,
+    Platform.BINARY_SENSOR,
+    Platform.SWITCH,
+    Platform.BUTTON,
+    Platform.DEVICE_TRACKER,
+    Platform.SELECT,
+    Platform.NUMBER,
+)
+
+# Platforms whose entities all depend on a feature toggle, skipped while it is off.
+# The toggles are FEATURE_FLAGS, so changing one reloads the entry and (un)loads them
+FEATURE_PLATFORMS: Final[dict[Platform, str]] = {
+    Platform.DEVICE_TRACKER: CONF_ENABLE_MOBILE_DEVICES,
+    Platform.NUMBER: CONF_ENABLE_FLOW_TEMP,
+}
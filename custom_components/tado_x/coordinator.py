@@ -1,25 +1,39 @@
 """DataUpdateCoordinator for Tado X."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import TYPE_CHECKING, Any, Callable
+from typing import Any, Callable
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import TadoXApi, TadoXApiError, TadoXAuthError, TadoXRateLimitError
-from .const import DOMAIN, SCAN_INTERVAL_AUTO_ASSIST, SCAN_INTERVAL_FREE_TIER
-
-if TYPE_CHECKING:
-    from homeassistant.config_entries import ConfigEntry
+from .const import (
+    API_QUOTA_FREE_TIER,
+    API_QUOTA_PREMIUM,
+    DEVICE_TYPE_MODELS,
+    DEVICE_TYPE_NAMES_FR,
+    DOMAIN,
+    PLATFORMS,
+    SCAN_INTERVAL_AUTO_ASSIST,
+    SCAN_INTERVAL_FREE_TIER,
+    DeviceType,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+TadoXConfigEntry = ConfigEntry["TadoXDataUpdateCoordinator"]
 
-@dataclass
+
+@dataclass(slots=True)
 class TadoXDevice:
     """Representation of a Tado X device."""
 
@@ -34,6 +48,8 @@ class TadoXDevice:
     child_lock_enabled: bool = False
     room_id: int | None = None
     room_name: str | None = None
+    # Domestic hot water state, only set on heat pump optimizers (CK04)
+    dhw_active: bool | None = None
 
 
 @dataclass
@@ -99,6 +115,12 @@ class TadoXData:
     rooms: dict[int, TadoXRoom] = field(default_factory=dict)
     devices: dict[str, TadoXDevice] = field(default_factory=dict)
     other_devices: list[TadoXDevice] = field(default_factory=list)
+    # Devices indexed by Tado device type (e.g. "VA04", "CK04")
+    devices_by_type: dict[str, list[TadoXDevice]] = field(default_factory=dict)
+    # Battery powered devices (valves, sensors), which get the device sensors
+    battery_devices: list[TadoXDevice] = field(default_factory=list)
+    # Serial numbers of same-type devices per (room id, device type), sorted for numbering
+    device_numbering: dict[tuple[int, str], list[str]] = field(default_factory=dict)
     presence: str | None = None  # HOME, AWAY, or None if not locked
     presence_locked: bool = False  # Whether presence is manually set
     api_calls_today: int = 0
@@ -107,6 +129,11 @@ class TadoXData:
     # Real values from Tado API response headers
     api_quota_limit: int | None = None  # From ratelimit-policy header (q=)
     api_quota_remaining: int | None = None  # From ratelimit header (r=)
+    # API usage derived once per update from the values above
+    api_quota: int = API_QUOTA_FREE_TIER
+    api_calls_used: int = 0
+    api_remaining: int = API_QUOTA_FREE_TIER
+    api_usage_percentage: float = 0.0
     # Weather data
     weather: TadoXWeather | None = None
     # Mobile devices for geofencing
@@ -131,6 +158,42 @@ class TadoXData:
     has_dhw_control: bool = False
 
 
+def _unwrap(result: Any) -> Any:
+    """Return a result gathered with return_exceptions, raising it if it failed."""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def _update_api_usage(data: TadoXData) -> None:
+    """Derive the API usage of the day.
+
+    Prefers real values from API headers if available, falls back to the
+    tier quota and the internal call counter.
+    """
+    if data.api_quota_limit is not None:
+        quota = data.api_quota_limit
+    else:
+        quota = API_QUOTA_PREMIUM if data.has_auto_assist else API_QUOTA_FREE_TIER
+
+    if data.api_quota_remaining is not None and data.api_quota_limit is not None:
+        calls_used = data.api_quota_limit - data.api_quota_remaining
+    else:
+        calls_used = data.api_calls_today
+
+    if data.api_quota_remaining is not None:
+        remaining = data.api_quota_remaining
+    else:
+        remaining = max(0, quota - data.api_calls_today)
+
+    data.api_quota = quota
+    data.api_calls_used = calls_used
+    data.api_remaining = remaining
+    data.api_usage_percentage = (
+        min(100, round((calls_used / quota) * 100, 1)) if quota else 100.0
+    )
+
+
 class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
     """Class to manage fetching Tado X data."""
 
@@ -166,6 +229,7 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
         self.home_id = home_id
         self.home_name = home_name
         self.api.home_id = home_id
+        self.api.set_request_interval(scan_interval)
         self._save_api_stats_callback = save_api_stats_callback
         self._scan_interval = scan_interval
 
@@ -176,6 +240,14 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
         self.enable_running_times = enable_running_times
         self.enable_flow_temp = enable_flow_temp
 
+        # Config entry values this coordinator was built from, used to skip no-op reloads
+        self.config_signature: tuple[Any, ...] | None = None
+        # Platforms forwarded for this entry, unloaded with the same set
+        self.platforms: tuple[Platform, ...] = PLATFORMS
+
+        # Device registry id -> Tado identifier, invalidated on registry updates
+        self._device_serial_cache: dict[str, str | None] = {}
+
         _LOGGER.info(
             "Tado X coordinator initialized with %d second update interval (%s tier)",
             scan_interval,
@@ -186,11 +258,77 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
             enable_weather, enable_mobile_devices, enable_air_comfort, enable_running_times, enable_flow_temp
         )
 
-    def update_scan_interval(self, new_interval: int) -> None:
-        """Update the scan interval dynamically."""
-        self._scan_interval = new_interval
-        self.update_interval = timedelta(seconds=new_interval)
-        _LOGGER.info("Scan interval updated to %d seconds", new_interval)
+    def build_device_info(self, serial_number: str) -> DeviceInfo:
+        """Return the device info of a Tado device, shared by its entities.
+
+        Home Assistant reads it once, when an entity is added.
+        """
+        device = self.data.devices.get(serial_number)
+        if not device:
+            return DeviceInfo(identifiers={(DOMAIN, serial_number)})
+
+        # Link to the room if the device has one, otherwise to the home
+        via_device_id = (
+            (DOMAIN, f"{self.home_id}_{device.room_id}")
+            if device.room_id
+            else (DOMAIN, str(self.home_id))
+        )
+
+        # Generate device name with room name and numbering
+        base_name = DEVICE_TYPE_NAMES_FR.get(device.device_type, device.device_type)
+
+        if device.room_id and device.room_name:
+            # Number devices of the same type in the same room
+            same_type_in_room = self.data.device_numbering.get(
+                (device.room_id, device.device_type), []
+            )
+            if len(same_type_in_room) > 1:
+                device_number = same_type_in_room.index(serial_number) + 1
+                device_name = f"{base_name} {device_number} - {device.room_name}"
+            else:
+                # Only one device of this type - no number needed
+                device_name = f"{base_name} - {device.room_name}"
+        else:
+            # No room - use serial number suffix (e.g., Bridge)
+            device_name = f"{base_name} ({serial_number[-4:]})"
+
+        return DeviceInfo(
+            identifiers={(DOMAIN, serial_number)},
+            name=device_name,
+            manufacturer="Tado",
+            model=DEVICE_TYPE_MODELS.get(device.device_type, device.device_type),
+            sw_version=device.firmware_version,
+            via_device=via_device_id,
+        )
+
+    @callback
+    def async_get_device_serial(self, device_id: str) -> str | None:
+        """Return the Tado identifier for a device registry entry.
+
+        The identifier is either a device serial number or home_id_room_id
+        for room devices. Devices of other config entries resolve to None.
+        Lookups are cached per device registry id.
+        """
+        if device_id in self._device_serial_cache:
+            return self._device_serial_cache[device_id]
+
+        device = dr.async_get(self.hass).async_get(device_id)
+        if device is None:
+            return None
+
+        serial = None
+        if self.config_entry and self.config_entry.entry_id in device.config_entries:
+            serial = next(
+                (identifier[1] for identifier in device.identifiers if identifier[0] == DOMAIN),
+                None,
+            )
+        self._device_serial_cache[device_id] = serial
+        return serial
+
+    @callback
+    def async_handle_device_registry_updated(self, event: Event) -> None:
+        """Drop the cached identifier of an updated or removed device."""
+        self._device_serial_cache.pop(event.data["device_id"], None)
 
     def get_api_calls_per_update(self) -> int:
         """Calculate the number of API calls per update based on enabled features."""
@@ -209,21 +347,22 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
     async def _async_update_data(self) -> TadoXData:
         """Fetch data from Tado X API."""
         try:
-            # Get rooms with current state (required)
-            rooms_data = await self.api.get_rooms()
-
-            # Get rooms with devices (required)
-            rooms_devices_data = await self.api.get_rooms_and_devices()
-
-            # Get home presence state (required)
-            home_state = await self.api.get_home_state()
+            # Get rooms, rooms with devices and home presence (required) together
+            # with weather and mobile devices (optional) in one concurrent batch
+            bundle = await self.api.fetch_refresh_bundle(
+                include_weather=self.enable_weather,
+                include_mobile_devices=self.enable_mobile_devices,
+            )
+            rooms_data = bundle["rooms"]
+            rooms_devices_data = bundle["rooms_devices"]
+            home_state = bundle["home_state"]
             presence = home_state.get("presence")
             presence_locked = home_state.get("presenceLocked", False)
 
-            # Get weather data (optional)
+            # Process weather data (optional)
             weather = None
             if self.enable_weather:
-                weather_data = await self.api.get_weather()
+                weather_data = bundle["weather"]
                 outdoor_temp_data = weather_data.get("outsideTemperature") or {}
                 solar_data = weather_data.get("solarIntensity") or {}
                 weather_state_data = weather_data.get("weatherState") or {}
@@ -234,10 +373,8 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                     weather_state=weather_state_data.get("value"),
                 )
 
-            # Get mobile devices for geofencing (optional)
-            mobile_devices_data = []
-            if self.enable_mobile_devices:
-                mobile_devices_data = await self.api.get_mobile_devices()
+            # Mobile devices for geofencing (optional)
+            mobile_devices_data = bundle.get("mobile_devices", [])
 
             # Process the data
             data = TadoXData(
@@ -338,6 +475,7 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                     )
                     room.devices.append(device)
                     data.devices[device.serial_number] = device
+                    data.devices_by_type.setdefault(device.device_type, []).append(device)
 
                 data.rooms[room_id] = room
 
@@ -362,7 +500,7 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                     other_room_name = data.rooms[other_room_id].name
                 # For Wireless Receiver X (TR04) without room, associate with the room
                 # that has the most devices (typically the main room it controls)
-                elif device_type == "TR04" and room_with_most_devices:
+                elif device_type == DeviceType.WIRELESS_RECEIVER and room_with_most_devices:
                     other_room_id = room_with_most_devices
                     other_room_name = data.rooms[room_with_most_devices].name
                     _LOGGER.debug(
@@ -388,6 +526,17 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
 
                 data.other_devices.append(device)
                 data.devices[device.serial_number] = device
+                data.devices_by_type.setdefault(device.device_type, []).append(device)
+
+            for device in data.devices.values():
+                if device.battery_state:
+                    data.battery_devices.append(device)
+                if device.room_id:
+                    data.device_numbering.setdefault(
+                        (device.room_id, device.device_type), []
+                    ).append(device.serial_number)
+            for serial_numbers in data.device_numbering.values():
+                serial_numbers.sort()
 
             # Process mobile devices
             for mobile_data in mobile_devices_data:
@@ -414,11 +563,28 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                 )
                 data.mobile_devices[device_id] = mobile_device
 
-            # Fetch running times data for today (optional)
+            # The optional requests are independent of each other, so they run
+            # concurrently; a failure only affects its own feature below
+            optional_requests: dict[str, Any] = {}
+            if self.enable_running_times:
+                today = date.today().isoformat()
+                optional_requests["running_times"] = self.api.get_running_times(today, today)
+            if self.enable_air_comfort:
+                optional_requests["air_comfort"] = self.api.get_air_comfort()
+            if self.enable_flow_temp:
+                optional_requests["flow_temp"] = self.api.get_flow_temperature_optimization()
+            optional_requests["dhw"] = self.api.get_dhw_state()
+            optional = dict(
+                zip(
+                    optional_requests,
+                    await asyncio.gather(*optional_requests.values(), return_exceptions=True),
+                )
+            )
+
+            # Process running times data for today (optional)
             if self.enable_running_times:
                 try:
-                    today = date.today().isoformat()
-                    running_times_data = await self.api.get_running_times(today, today)
+                    running_times_data = _unwrap(optional["running_times"])
                     data.running_times = running_times_data
 
                     # Process running times per zone/room
@@ -439,10 +605,10 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                     _LOGGER.warning("Failed to fetch running times data: %s", err)
                     data.running_times = {}
 
-            # Fetch air comfort data (optional)
+            # Process air comfort data (optional)
             if self.enable_air_comfort:
                 try:
-                    air_comfort_data = await self.api.get_air_comfort()
+                    air_comfort_data = _unwrap(optional["air_comfort"])
                     comfort_list = air_comfort_data.get("comfort", [])
                     for comfort_entry in comfort_list:
                         room_id = comfort_entry.get("roomId")
@@ -467,10 +633,10 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                     # Air comfort endpoint might not be available for all accounts
                     _LOGGER.warning("Failed to fetch air comfort data: %s", err)
 
-            # Fetch flow temperature optimization settings (if available and enabled)
+            # Process flow temperature optimization settings (if available and enabled)
             if self.enable_flow_temp:
                 try:
-                    flow_data = await self.api.get_flow_temperature_optimization()
+                    flow_data = _unwrap(optional["flow_temp"])
                     if flow_data:
                         data.has_flow_temp_control = True
                         data.max_flow_temperature = flow_data.get("maxFlowTemperature")
@@ -492,13 +658,16 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                     # (requires OpenTherm-compatible boiler control device)
                     _LOGGER.debug("Flow temperature optimization not available: %s", err)
                     data.has_flow_temp_control = False
-                        # Fetch Domestic Hot Water state (CK04)
+
+            # Process Domestic Hot Water state (CK04)
             try:
-                dhw_state = await self.api.get_dhw_state()
+                dhw_state = _unwrap(optional["dhw"])
                 if dhw_state:
                     data.has_dhw_control = True
                     data.dhw_active = dhw_state.get("active")
                     data.dhw_boost_active = dhw_state.get("boostActive", False)
+                    for device in data.devices_by_type.get(DeviceType.HEAT_PUMP_OPTIMIZER, []):
+                        device.dhw_active = data.dhw_active
 
                     _LOGGER.debug(
                         "DHW state - active: %s, boost: %s",
@@ -515,6 +684,7 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
             data.has_auto_assist = self.api.has_auto_assist
             data.api_quota_limit = self.api.api_quota_limit
             data.api_quota_remaining = self.api.api_quota_remaining
+            _update_api_usage(data)
 
             # Save API stats for persistence
             if self._save_api_stats_callback:
@@ -534,12 +704,14 @@ class TadoXDataUpdateCoordinator(DataUpdateCoordinator[TadoXData]):
                 self.data.rate_limit_reset = err.reset_time
                 return self.data
             # No previous data - create minimal data with rate limited status
-            return TadoXData(
+            data = TadoXData(
                 home_id=self.home_id,
                 home_name=self.home_name,
                 rate_limited=True,
                 rate_limit_reset=err.reset_time,
             )
+            _update_api_usage(data)
+            return data
         except TadoXAuthError as err:
             # Trigger reauthentication flow instead of just failing
             # This will prompt the user to re-authenticate via the UI
@@ -2,27 +2,36 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
+from typing import Any
 
 from homeassistant.components.device_tracker import SourceType, TrackerEntity
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import TadoXDataUpdateCoordinator, TadoXMobileDevice
+from .coordinator import TadoXConfigEntry, TadoXDataUpdateCoordinator, TadoXMobileDevice
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _format_model(platform: str, model: str) -> str:
+    """Build the model string of a mobile device."""
+    if platform and model:
+        return f"{platform} - {model}"
+    return platform or "Mobile Device"
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: TadoXConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Tado X device tracker entities."""
-    coordinator: TadoXDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry.runtime_data
 
     entities: list[TrackerEntity] = []
 
@@ -50,23 +59,25 @@ class TadoXMobileDeviceTracker(
         super().__init__(coordinator)
         self._device_id = device_id
         self._attr_unique_id = f"{coordinator.home_id}_mobile_{device_id}"
+        self._fallback_name = f"Mobile {device_id}"
+        self._mobile: TadoXMobileDevice | None = coordinator.data.mobile_devices.get(device_id)
+        self._attr_device_info = self._build_device_info(coordinator.home_id)
+        self._attrs_cache: dict[str, Any] | None = None
+        self._attrs_key: tuple[Any, ...] | None = None
 
     @property
     def _mobile_device(self) -> TadoXMobileDevice | None:
-        """Get the mobile device data."""
-        return self.coordinator.data.mobile_devices.get(self._device_id)
+        """Get the mobile device data, as of the last coordinator update."""
+        return self._mobile
 
     @property
     def name(self) -> str:
         """Return the name of the device."""
         mobile = self._mobile_device
-        if mobile:
-            return mobile.name
-        return f"Mobile {self._device_id}"
+        return mobile.name if mobile else self._fallback_name
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
+    def _build_device_info(self, home_id: int) -> DeviceInfo:
+        """Return device info; Home Assistant reads it once, when the entity is added."""
         mobile = self._mobile_device
         metadata = mobile.device_metadata if mobile else {}
 
@@ -75,20 +86,13 @@ class TadoXMobileDeviceTracker(
         os_version = metadata.get("osVersion", "")
         model = metadata.get("model", "")
 
-        # Build model string
-        model_str = "Mobile Device"
-        if platform and model:
-            model_str = f"{platform} - {model}"
-        elif platform:
-            model_str = platform
-
         return DeviceInfo(
             identifiers={(DOMAIN, f"mobile_{self._device_id}")},
-            name=mobile.name if mobile else f"Mobile {self._device_id}",
+            name=mobile.name if mobile else self._fallback_name,
             manufacturer="Tado",
-            model=model_str,
-            sw_version=os_version if os_version else None,
-            via_device=(DOMAIN, str(self.coordinator.home_id)),
+            model=_format_model(platform, model),
+            sw_version=os_version or None,
+            via_device=(DOMAIN, str(home_id)),
         )
 
     @property
@@ -113,22 +117,32 @@ class TadoXMobileDeviceTracker(
 
     @property
     def extra_state_attributes(self) -> dict:
-        """Return extra state attributes."""
+        """Return extra state attributes, reusing the last dict when unchanged."""
         mobile = self._mobile_device
         if not mobile:
             return {}
 
         metadata = mobile.device_metadata
-        return {
-            "geofencing_enabled": mobile.geofencing_enabled,
-            "at_home": mobile.at_home,
-            "platform": metadata.get("platform"),
-            "os_version": metadata.get("osVersion"),
-            "model": metadata.get("model"),
-            "locale": metadata.get("locale"),
-        }
+        key = (
+            mobile.geofencing_enabled,
+            mobile.at_home,
+            metadata.get("platform"),
+            metadata.get("osVersion"),
+            metadata.get("model"),
+            metadata.get("locale"),
+        )
+        if self._attrs_cache is None or key != self._attrs_key:
+            self._attrs_key = key
+            self._attrs_cache = dict(
+                zip(
+                    ("geofencing_enabled", "at_home", "platform", "os_version", "model", "locale"),
+                    key,
+                )
+            )
+        return self._attrs_cache
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        self._mobile = self.coordinator.data.mobile_devices.get(self._device_id)
         self.async_write_ha_state()
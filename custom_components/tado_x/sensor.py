@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -12,15 +12,15 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import API_QUOTA_FREE_TIER, API_QUOTA_PREMIUM, DOMAIN
+from .const import DOMAIN
 from .coordinator import (
+    TadoXConfigEntry,
     TadoXData,
     TadoXDataUpdateCoordinator,
     TadoXDevice,
@@ -31,56 +31,39 @@ from .coordinator import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Tado battery states mapped to the battery sensor options
+_BATTERY_STATES: Final = {"NORMAL": "normal", "LOW": "low", "normal": "normal", "low": "low"}
 
-def _get_api_quota(data: TadoXData) -> int:
-    """Get the appropriate API quota.
 
-    Prefers real value from API headers if available, falls back to default values.
-    """
-    if data.api_quota_limit is not None:
-        return data.api_quota_limit
-    return API_QUOTA_PREMIUM if data.has_auto_assist else API_QUOTA_FREE_TIER
-
-
-def _get_api_remaining(data: TadoXData) -> int:
-    """Get remaining API calls.
-
-    Prefers real value from API headers if available, falls back to calculated value.
-    """
-    if data.api_quota_remaining is not None:
-        return data.api_quota_remaining
-    return max(0, _get_api_quota(data) - data.api_calls_today)
-
-
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TadoXRoomSensorEntityDescription(SensorEntityDescription):
     """Describes a Tado X room sensor entity."""
 
     value_fn: Callable[[TadoXRoom], Any]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TadoXDeviceSensorEntityDescription(SensorEntityDescription):
     """Describes a Tado X device sensor entity."""
 
     value_fn: Callable[[TadoXDevice], Any]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TadoXHomeSensorEntityDescription(SensorEntityDescription):
     """Describes a Tado X home sensor entity."""
 
     value_fn: Callable[[TadoXData], Any]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TadoXWeatherSensorEntityDescription(SensorEntityDescription):
     """Describes a Tado X weather sensor entity."""
 
     value_fn: Callable[[TadoXWeather], Any]
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class TadoXAirComfortSensorEntityDescription(SensorEntityDescription):
     """Describes a Tado X air comfort sensor entity."""
 
@@ -136,7 +119,7 @@ DEVICE_SENSORS: tuple[TadoXDeviceSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENUM,
         options=["normal", "low"],
         icon="mdi:battery",
-        value_fn=lambda device: device.battery_state.lower() if device.battery_state else None,
+        value_fn=lambda device: _BATTERY_STATES.get(device.battery_state),
     ),
     TadoXDeviceSensorEntityDescription(
         key="device_temperature",
@@ -157,37 +140,6 @@ DEVICE_SENSORS: tuple[TadoXDeviceSensorEntityDescription, ...] = (
     ),
 )
 
-def _get_api_usage_percentage(data: TadoXData) -> float:
-    """Calculate API usage percentage.
-
-    Uses real values from API headers when available for accurate calculation.
-    """
-    quota = _get_api_quota(data)
-    if quota == 0:
-        return 100.0
-
-    # Calculate calls used based on quota and remaining
-    if data.api_quota_remaining is not None and data.api_quota_limit is not None:
-        # Use real values from headers
-        calls_used = data.api_quota_limit - data.api_quota_remaining
-    else:
-        # Fall back to internal counter
-        calls_used = data.api_calls_today
-
-    return min(100, round((calls_used / quota) * 100, 1))
-
-
-def _get_api_calls_today(data: TadoXData) -> int:
-    """Get API calls made today.
-
-    Uses real values from API headers when available.
-    """
-    if data.api_quota_remaining is not None and data.api_quota_limit is not None:
-        # Calculate from real header values
-        return data.api_quota_limit - data.api_quota_remaining
-    return data.api_calls_today
-
-
 def _get_api_status(data: TadoXData) -> str:
     """Get API status - OK or RATE_LIMITED."""
     return "RATE_LIMITED" if data.rate_limited else "OK"
@@ -211,21 +163,21 @@ HOME_SENSORS: tuple[TadoXHomeSensorEntityDescription, ...] = (
         translation_key="api_calls_today",
         icon="mdi:counter",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_get_api_calls_today,
+        value_fn=lambda data: data.api_calls_used,
     ),
     TadoXHomeSensorEntityDescription(
         key="api_quota_remaining",
         translation_key="api_quota_remaining",
         icon="mdi:api",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_get_api_remaining,
+        value_fn=lambda data: data.api_remaining,
     ),
     TadoXHomeSensorEntityDescription(
         key="api_quota_limit",
         translation_key="api_quota_limit",
         icon="mdi:api",
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_get_api_quota,
+        value_fn=lambda data: data.api_quota,
     ),
     TadoXHomeSensorEntityDescription(
         key="api_usage_percentage",
@@ -233,7 +185,7 @@ HOME_SENSORS: tuple[TadoXHomeSensorEntityDescription, ...] = (
         icon="mdi:percent",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
-        value_fn=_get_api_usage_percentage,
+        value_fn=lambda data: data.api_usage_percentage,
     ),
     TadoXHomeSensorEntityDescription(
         key="api_reset_time",
@@ -317,56 +269,72 @@ AIR_COMFORT_SENSORS: tuple[TadoXAirComfortSensorEntityDescription, ...] = (
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: TadoXConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Tado X sensor entities."""
-    coordinator: TadoXDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-    entities: list[SensorEntity] = []
+    coordinator = entry.runtime_data
 
     # Add home-level sensors (API monitoring)
-    for description in HOME_SENSORS:
-        entities.append(TadoXHomeSensor(coordinator, description))
+    entities: list[SensorEntity] = [
+        TadoXHomeSensor(coordinator, description) for description in HOME_SENSORS
+    ]
 
     # Add weather sensors (only if feature is enabled)
     if coordinator.enable_weather:
-        for description in WEATHER_SENSORS:
-            entities.append(TadoXWeatherSensor(coordinator, description))
-
-    # Add room sensors
-    for room_id in coordinator.data.rooms:
-        for description in ROOM_SENSORS:
-            # Skip heating_time_today if running times feature is disabled
-            if description.key == "heating_time_today" and not coordinator.enable_running_times:
-                continue
-            entities.append(TadoXRoomSensor(coordinator, room_id, description))
-
-    # Add device sensors (for devices with batteries - valves and sensors)
-    for device in coordinator.data.devices.values():
-        if device.battery_state:  # Only devices with batteries
-            for description in DEVICE_SENSORS:
-                # Skip device temperature for sensors that don't have it
-                if description.key == "device_temperature" and device.temperature_measured is None:
-                    continue
-                # Skip temperature offset for devices that don't support it (Bridge)
-                if description.key == "temperature_offset" and device.temperature_offset is None:
-                    continue
-                entities.append(TadoXDeviceSensor(coordinator, device.serial_number, description))
+        entities.extend(
+            TadoXWeatherSensor(coordinator, description) for description in WEATHER_SENSORS
+        )
+
+    # Add room sensors, without heating_time_today if running times are disabled
+    entities.extend(
+        TadoXRoomSensor(coordinator, room_id, description)
+        for room_id in coordinator.data.rooms
+        for description in ROOM_SENSORS
+        if description.key != "heating_time_today" or coordinator.enable_running_times
+    )
+
+    # Add device sensors (for devices with batteries - valves and sensors),
+    # skipping device temperature and offset where a device does not report them (Bridge)
+    entities.extend(
+        TadoXDeviceSensor(coordinator, device.serial_number, description)
+        for device in coordinator.data.battery_devices
+        for description in DEVICE_SENSORS
+        if not (description.key == "device_temperature" and device.temperature_measured is None)
+        and not (description.key == "temperature_offset" and device.temperature_offset is None)
+    )
 
     # Add air comfort sensors (per room) - only if feature is enabled
     if coordinator.enable_air_comfort:
-        for room_id in coordinator.data.rooms:
-            for description in AIR_COMFORT_SENSORS:
-                entities.append(TadoXAirComfortSensor(coordinator, room_id, description))
+        entities.extend(
+            TadoXAirComfortSensor(coordinator, room_id, description)
+            for room_id in coordinator.data.rooms
+            for description in AIR_COMFORT_SENSORS
+        )
 
     async_add_entities(entities)
 
 
-class TadoXHomeSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEntity):
-    """Tado X home sensor entity."""
+class TadoXSensorEntity(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEntity):
+    """Base for Tado X sensors, writing state only when it changed."""
 
     _attr_has_entity_name = True
+    # Value and availability of the last written state
+    _last_snapshot: tuple[Any, bool] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        snapshot = (self.native_value, self.available)
+        if snapshot == self._last_snapshot:
+            return
+        self._last_snapshot = snapshot
+        self.async_write_ha_state()
+
+
+class TadoXHomeSensor(TadoXSensorEntity):
+    """Tado X home sensor entity."""
+
     entity_description: TadoXHomeSensorEntityDescription
 
     def __init__(
@@ -393,16 +361,10 @@ class TadoXHomeSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEntit
         """Return the sensor value."""
         return self.entity_description.value_fn(self.coordinator.data)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
 
-class TadoXWeatherSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEntity):
+class TadoXWeatherSensor(TadoXSensorEntity):
     """Tado X weather sensor entity."""
 
-    _attr_has_entity_name = True
     entity_description: TadoXWeatherSensorEntityDescription
 
     def __init__(
@@ -432,16 +394,10 @@ class TadoXWeatherSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEn
             return None
         return self.entity_description.value_fn(weather)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
 
-class TadoXRoomSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEntity):
+class TadoXRoomSensor(TadoXSensorEntity):
     """Tado X room sensor entity."""
 
-    _attr_has_entity_name = True
     entity_description: TadoXRoomSensorEntityDescription
 
     def __init__(
@@ -455,6 +411,8 @@ class TadoXRoomSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEntit
         self._room_id = room_id
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.home_id}_{room_id}_{description.key}"
+        self._identifiers = {(DOMAIN, f"{coordinator.home_id}_{room_id}")}
+        self._via_device = (DOMAIN, str(coordinator.home_id))
 
     @property
     def _room(self) -> TadoXRoom | None:
@@ -468,11 +426,11 @@ class TadoXRoomSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEntit
         room_name = room.name if room else f"Room {self._room_id}"
 
         return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.coordinator.home_id}_{self._room_id}")},
+            identifiers=self._identifiers,
             name=room_name,
             manufacturer="Tado",
             model="Tado X Room",
-            via_device=(DOMAIN, str(self.coordinator.home_id)),
+            via_device=self._via_device,
         )
 
     @property
@@ -483,16 +441,10 @@ class TadoXRoomSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEntit
             return None
         return self.entity_description.value_fn(room)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
 
-
-class TadoXDeviceSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEntity):
+class TadoXDeviceSensor(TadoXSensorEntity):
     """Tado X device sensor entity."""
 
-    _attr_has_entity_name = True
     entity_description: TadoXDeviceSensorEntityDescription
 
     def __init__(
@@ -506,76 +458,13 @@ class TadoXDeviceSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEnt
         self._serial_number = serial_number
         self.entity_description = description
         self._attr_unique_id = f"{serial_number}_{description.key}"
+        self._attr_device_info = coordinator.build_device_info(serial_number)
 
     @property
     def _device(self) -> TadoXDevice | None:
         """Get the device data."""
         return self.coordinator.data.devices.get(self._serial_number)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        device = self._device
-        if not device:
-            return DeviceInfo(
-                identifiers={(DOMAIN, self._serial_number)},
-            )
-
-        # French names for device types (used in device name)
-        device_type_names_fr = {
-            "VA04": "Vanne",
-            "SU04": "Capteur Temp",
-            "TR04": "Récepteur",  # Wireless Receiver X
-            "RU04": "Thermostat",  # Wired Smart Thermostat X
-            "IB02": "Bridge X",
-        }
-
-        # English model names (used in device model field)
-        device_type_models = {
-            "VA04": "Radiator Valve X",
-            "SU04": "Temperature Sensor X",
-            "TR04": "Wireless Receiver X",
-            "RU04": "Wired Smart Thermostat X",
-            "IB02": "Bridge X",
-        }
-
-        # Determine via_device - link to room if device has one, otherwise to home
-        via_device_id = (
-            (DOMAIN, f"{self.coordinator.home_id}_{device.room_id}")
-            if device.room_id
-            else (DOMAIN, str(self.coordinator.home_id))
-        )
-
-        # Generate device name with room name and numbering
-        base_name = device_type_names_fr.get(device.device_type, device.device_type)
-
-        if device.room_id and device.room_name:
-            # Count devices of same type in same room to determine numbering
-            same_type_in_room = sorted([
-                d.serial_number for d in self.coordinator.data.devices.values()
-                if d.room_id == device.room_id and d.device_type == device.device_type
-            ])
-
-            if len(same_type_in_room) > 1:
-                # Multiple devices of same type - add number
-                device_number = same_type_in_room.index(self._serial_number) + 1
-                device_name = f"{base_name} {device_number} - {device.room_name}"
-            else:
-                # Only one device of this type - no number needed
-                device_name = f"{base_name} - {device.room_name}"
-        else:
-            # No room - use serial number suffix (e.g., Bridge)
-            device_name = f"{base_name} ({self._serial_number[-4:]})"
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._serial_number)},
-            name=device_name,
-            manufacturer="Tado",
-            model=device_type_models.get(device.device_type, device.device_type),
-            sw_version=device.firmware_version,
-            via_device=via_device_id,
-        )
-
     @property
     def native_value(self) -> Any:
         """Return the sensor value."""
@@ -584,16 +473,10 @@ class TadoXDeviceSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEnt
             return None
         return self.entity_description.value_fn(device)
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
 
-class TadoXAirComfortSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], SensorEntity):
+class TadoXAirComfortSensor(TadoXSensorEntity):
     """Tado X air comfort sensor entity."""
 
-    _attr_has_entity_name = True
     entity_description: TadoXAirComfortSensorEntityDescription
 
     def __init__(
@@ -607,6 +490,8 @@ class TadoXAirComfortSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], Senso
         self._room_id = room_id
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.home_id}_{room_id}_{description.key}"
+        self._identifiers = {(DOMAIN, f"{coordinator.home_id}_{room_id}")}
+        self._via_device = (DOMAIN, str(coordinator.home_id))
 
     @property
     def _air_comfort(self) -> TadoXRoomAirComfort | None:
@@ -625,11 +510,11 @@ class TadoXAirComfortSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], Senso
         room_name = room.name if room else f"Room {self._room_id}"
 
         return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.coordinator.home_id}_{self._room_id}")},
+            identifiers=self._identifiers,
             name=room_name,
             manufacturer="Tado",
             model="Tado X Room",
-            via_device=(DOMAIN, str(self.coordinator.home_id)),
+            via_device=self._via_device,
         )
 
     @property
@@ -639,8 +524,3 @@ class TadoXAirComfortSensor(CoordinatorEntity[TadoXDataUpdateCoordinator], Senso
         if not air_comfort:
             return None
         return self.entity_description.value_fn(air_comfort)
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
@@ -4,29 +4,27 @@ from __future__ import annotations
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchDeviceClass
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
-from .coordinator import TadoXDataUpdateCoordinator
+from .const import DOMAIN, DeviceType
+from .coordinator import TadoXConfigEntry, TadoXDataUpdateCoordinator
 
 async def async_setup_entry(
     hass: HomeAssistant,
-    entry: ConfigEntry,
+    entry: TadoXConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Tado X switches."""
-    coordinator: TadoXDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
-
-    entities: list[SwitchEntity] = []
+    coordinator = entry.runtime_data
 
     # Detect CK04 devices (Heat Pump Optimizer)
-    for device in coordinator.data.devices.values():
-        if device.device_type.upper() == "CK04":
-            entities.append(TadoXHeatPumpBoilerSwitch(coordinator, device.serial_number))
+    entities: list[SwitchEntity] = [
+        TadoXHeatPumpBoilerSwitch(coordinator, device.serial_number)
+        for device in coordinator.data.devices_by_type.get(DeviceType.HEAT_PUMP_OPTIMIZER, [])
+    ]
 
     if entities:
         async_add_entities(entities)
@@ -40,18 +38,21 @@ class TadoXHeatPumpBoilerSwitch(
     _attr_has_entity_name = True
     _attr_device_class = SwitchDeviceClass.SWITCH
     _attr_icon = "mdi:water-boiler"
+    _attr_translation_key = "heat_pump_dhw"
 
     def __init__(self, coordinator: TadoXDataUpdateCoordinator, serial_number: str) -> None:
         """Initialize the switch."""
         super().__init__(coordinator)
         self._serial_number = serial_number
         self._attr_unique_id = f"{serial_number}_dhw"
-        self._attr_name = "Heatpump Boiler DHW"
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
-        device = self.coordinator.data.devices[self._serial_number]
+        device = self.coordinator.data.devices.get(self._serial_number)
+        if device is None:
+            # Device missing from the last poll, keep the entity linked to it
+            return DeviceInfo(identifiers={(DOMAIN, self._serial_number)})
         return DeviceInfo(
             identifiers={(DOMAIN, self._serial_number)},
             manufacturer="Tado",
@@ -61,24 +62,16 @@ class TadoXHeatPumpBoilerSwitch(
 
     @property
     def is_on(self) -> bool | None:
-        """Return the current switch state from coordinator."""
+        """Return the current DHW state from the coordinator."""
         device = self.coordinator.data.devices.get(self._serial_number)
-        if device is None:
-            return None
-        return getattr(device, "dhw_active", False)
+        return device.dhw_active if device else None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Enable domestic hot water."""
         await self.coordinator.api.dhw_on()
-        device = self.coordinator.data.devices.get(self._serial_number)
-        if device:
-            device.dhw_active = True
-        self.async_write_ha_state()
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Disable domestic hot water."""
         await self.coordinator.api.dhw_off()
-        device = self.coordinator.data.devices.get(self._serial_number)
-        if device:
-            device.dhw_active = False
-        self.async_write_ha_state()
+        await self.coordinator.async_request_refresh()